@@ -1,12 +1,12 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from dotenv import dotenv_values
 import asyncio
 import logging
 import sys
 import os
 
+from libs.config import config
 from libs.database_loader import init_db
 
 # ---------------------------
@@ -23,9 +23,8 @@ logger = logging.getLogger("bot")
 logger.info("Logging configured successfully.")
 
 # ---------------------------
-# Load configuration from .env
+# Check configuration from .env
 # ---------------------------
-config = dotenv_values(".env")
 if "DISCORD_KEY" not in config:
     logger.error("DISCORD_KEY not found in .env file.")
     raise SystemExit(1)
@@ -1,26 +1,342 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
 import logging
 import uuid
 import gspread  # for catching gspread.exceptions.APIError
 
-from libs.character import Character
+from libs.cache import TTLCache
+from libs.character import Character, flush_pending_saves
 from libs.personas import (
     generate_default_header,
+    invalidate_persona_cache,
 )
+from libs.role import invalidate_role_index
 from libs.sheet_loader import get_client
-from libs.database_loader import list_characters_for_user, create_or_update_persona, update_persona_name_by_old_name
+from libs.database_loader import (
+    create_or_update_persona,
+    update_persona_name_by_old_name,
+    get_archived_blood_log,
+)
 
 logger = logging.getLogger(__name__)
 
+# Discord's per-field value limit
+FIELD_LIMIT = 1024
+
+# Discord's nickname length limit
+NICK_LIMIT = 32
+
+# How often deferred character saves (blood adjustments) are written out
+SAVE_FLUSH_INTERVAL = 2  # seconds
+
+# Rendered /character show pages, keyed by (uuid, rev, footer name). rev is a
+# unique token per save, so a key never outlives the data it was rendered from
+PAGE_CACHE_TTL = 3600
+PAGE_CACHE_MAX = 256
+_page_cache = TTLCache(PAGE_CACHE_TTL, maxsize=PAGE_CACHE_MAX)
+
+# Archived blood log entries shown per /character blood-log page
+BLOOD_ARCHIVE_PAGE_SIZE = 10
+
+# Blood log table layout
+BLOOD_LOG_COLOR = discord.Color.dark_red().value
+BLOOD_LOG_HEADER = f"{'Date':<12} | {'Δ':<5} | {'Result':<6} | {'Reason':<18}"
+BLOOD_LOG_ROW = "{date:<12} | {delta:<5} | {result:<6} | {comment:<18}"
+
+
+def _join_capped(items, fmt, cap: int = FIELD_LIMIT) -> str:
+    """
+    Format and newline-join items, stopping before the joined text would exceed `cap`.
+    Only the lines Discord will actually display are formatted.
+    """
+    out = []
+    length = -1  # no separator before the first line
+    for item in items:
+        line = fmt(item)
+        length += len(line) + 1
+        if length > cap:
+            if not out:
+                out.append(line[:cap])
+            break
+        out.append(line)
+    return "\n".join(out)
+
+
+def _character_nick(char: Character, base_username: str) -> str:
+    """
+    Nickname for a member playing char: "<character> || <player>".
+    Over-long names trim the character part first so the player stays identifiable.
+    """
+    playername = (char.player_name or "").strip()
+    suffix = f" || {base_username if playername in ('Player Name', '') else playername}"
+    name = char.name or ""
+    if len(name) + len(suffix) > NICK_LIMIT:
+        name = name[: max(NICK_LIMIT - len(suffix), 1)]
+    return f"{name}{suffix}"[:NICK_LIMIT]
+
+
+async def _update_nick(member: discord.Member, nick: str) -> bool:
+    """Set member's nickname, skipping the REST call when it's already set. Returns True if edited."""
+    if member.nick == nick:
+        return False
+    await member.edit(nick=nick)
+    return True
+
+
+def _blood_timestamp() -> int:
+    """Timestamp for a new blood log entry (UTC epoch seconds)."""
+    return int(datetime.now(timezone.utc).timestamp())
+
+
+def _format_blood_row(entry: dict) -> str:
+    """Format one blood log entry as a BLOOD_LOG_ROW table line."""
+    timestamp = entry.get("timestamp", "")
+    try:
+        if isinstance(timestamp, (int, float)):
+            ts = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        else:
+            ts = datetime.fromisoformat(timestamp)
+        date = ts.strftime("%d/%m/%Y")
+    except Exception:
+        date = str(timestamp)
+    return BLOOD_LOG_ROW.format(
+        date=date,
+        delta=str(entry.get("delta", "")),
+        result=str(entry.get("result", "")),
+        comment=(entry.get("comment", "") or "")[:18],
+    )
+
+
+def _fmt_rated(t: dict) -> str:
+    return f"**{t['name']}** {t['value']}"
+
+
+def _fmt_points(t: dict) -> str:
+    return f"{t['name'].split('(')[0]} ({t['rating']}pt)"
+
+
+# /character show layout: (field name, Character attribute, fallback, inline)
+_SHOW_PROFILE_FIELDS = (
+    ("Clan", "clan", "Unknown", True),
+    ("Generation", "generation", "?", True),
+    ("Sect", "sect", "Unknown", True),
+    ("Concept", "concept", "Unknown", False),
+)
+
+# Page 2 trait lists: (field name, Character attribute, line formatter, inline)
+_SHOW_TRAIT_FIELDS = (
+    ("Disciplines", "disciplines", _fmt_rated, False),
+    ("Backgrounds", "backgrounds", _fmt_rated, True),
+    ("Merits", "merits", _fmt_points, True),
+    ("Flaws", "flaws", _fmt_points, True),
+)
+
+ABILITY_ORDER = (
+    "Talents",
+    "Skills",
+    "Knowledges",
+    "Hobby Talents",
+    "Professional Skill",
+    "Expert Knowledge",
+)
+
+
+def _build_character_pages(char: Character, footer_name: str):
+    """
+    Build the /character show embeds for a character.
+    Returns (page1, page2, page3); page3 is None when there are no rituals or sorcery paths.
+    """
+    # === PAGE 1 ===
+    page1 = discord.Embed(
+        title=f"{char.name or 'Unknown'}",
+        description=f"Player: {char.player_name or 'Unknown'}",
+        color=discord.Color.dark_red(),
+    )
+    for name, attr, fallback, inline in _SHOW_PROFILE_FIELDS:
+        page1.add_field(name=name, value=str(getattr(char, attr, None) or fallback), inline=inline)
+    page1.add_field(
+        name="Nature / Demeanor",
+        value=f"{char.nature or '?'} / {char.demeanor or '?'}",
+        inline=False,
+    )
+
+    page1.add_field(
+        name="Willpower",
+        value=f"{char.curr_willpower}/{char.max_willpower}",
+        inline=True,
+    )
+    page1.add_field(name="\u200b", value="\u200b", inline=True)
+    page1.add_field(
+        name="Blood Pool",
+        value=f"{char.curr_blood}/{char.max_blood} (Per Turn: {char.blood_per_turn})",
+        inline=True,
+    )
+
+    # Attributes
+    names, values = char.attr_names, char.attr_values
+    if len(names) >= 9:
+        def format_attr_block(start, end):
+            return "\n".join([f"**{n}** {v}" for n, v in zip(names[start:end], values[start:end])])
+
+        page1.add_field(name="Physical", value=format_attr_block(0, 3), inline=True)
+        page1.add_field(name="Social", value=format_attr_block(3, 6), inline=True)
+        page1.add_field(name="Mental", value=format_attr_block(6, 9), inline=True)
+
+    # Abilities
+    for cat in ABILITY_ORDER:
+        cols = char.ability_cols.get(cat)
+        text = cols and "\n".join([f"**{n}** {v}" for n, v in zip(cols["names"], cols["values"]) if v > 0])
+        page1.add_field(name=cat, value=text or "—", inline=True)
+
+    page1.set_footer(text=f"User: {footer_name}")
+
+    # === PAGE 2 ===
+    page2 = discord.Embed(
+        title=f"{char.name or 'Unknown'}",
+        description="Disciplines, Backgrounds, Merits, Flaws, Virtues, Path",
+        color=discord.Color.dark_red(),
+    )
+
+    for name, attr, fmt, inline in _SHOW_TRAIT_FIELDS:
+        traits = getattr(char, attr, None)
+        if traits:
+            page2.add_field(name=name, value=_join_capped(traits, fmt), inline=inline)
+
+    if char.virtues:
+        virtues_text = "\n".join([_fmt_rated(v) for v in char.virtues])
+        page2.add_field(name="Virtues", value=virtues_text, inline=True)
+
+    if char.path:
+        page2.add_field(
+            name="Path",
+            value=f"**{char.path['name']}** {char.path['value']}",
+            inline=True,
+        )
+
+    page2.set_footer(text=f"User: {footer_name}")
+
+    # === PAGE 3 ===
+    has_rituals = bool(char.rituals)
+    has_paths = any((p.get('level') or 0) != 0 for p in char.magic_paths)
+    page3 = None
+
+    if has_rituals or has_paths:
+        page3 = discord.Embed(
+            title=f"{char.name or 'Unknown'}",
+            description="Rituals & Sorcery Paths",
+            color=discord.Color.dark_red(),
+        )
+
+        if has_paths:
+            paths_text = _join_capped(
+                [p for p in char.magic_paths if p['level'] != 0],
+                lambda p: f"**{p['name'].split('(')[0]}** {p['level']}",
+            )
+            page3.add_field(name="Paths", value=paths_text, inline=False)
+
+        if has_rituals:
+            all_sorc = [r.get('sorc_type', 'Rituals') for r in char.rituals]
+            sorc_types = sorted(set(all_sorc))
+
+            for sorc in sorc_types:
+                rituals = [r for r in char.rituals if r.get('sorc_type') == sorc]
+                rituals.sort(key=lambda r: r.get('level', 0))
+
+                rituals_text = _join_capped(
+                    rituals, lambda r: f"{r.get('name', 'Unknown')} _(Lvl {r.get('level', '?')})_"
+                )
+
+                page3.add_field(
+                    name=f"{sorc} Rituals",
+                    value=rituals_text or "None available.",
+                    inline=False
+                )
+        else:
+            page3.add_field(name="Rituals", value="None available.", inline=False)
+
+        page3.set_footer(text=f"User: {footer_name}")
+
+    return page1, page2, page3
+
+
+# ---------------------------
+# Pagination View for /character show
+# ---------------------------
+class CharacterView(discord.ui.View):
+    def __init__(self, page1: discord.Embed, page2: discord.Embed, page3: discord.Embed = None):
+        super().__init__(timeout=120)
+        self.pages = [page1, page2, page3]
+        self.buttons = [self.page1_button, self.page2_button, self.page3_button]
+        if page3 is None:
+            self.remove_item(self.page3_button)
+
+    async def show_page(self, interaction: discord.Interaction, index: int):
+        """Switch to the given page, disabling only its own button."""
+        for i, button in enumerate(self.buttons):
+            button.disabled = i == index
+        await interaction.response.edit_message(embed=self.pages[index], view=self)
+
+    @discord.ui.button(label="Page 1", style=discord.ButtonStyle.primary, disabled=True)
+    async def page1_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, 0)
+
+    @discord.ui.button(label="Page 2", style=discord.ButtonStyle.primary)
+    async def page2_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, 1)
+
+    @discord.ui.button(label="Page 3", style=discord.ButtonStyle.primary)
+    async def page3_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, 2)
+
 
 class CharacterCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         logger.info("Character Cog registered")
 
+    async def cog_load(self):
+        self.flush_saves.start()
+
+    async def cog_unload(self):
+        self.flush_saves.cancel()
+        await asyncio.to_thread(flush_pending_saves)
+
+    # ---------------------------
+    # Deferred Save Flusher
+    # ---------------------------
+    @tasks.loop(seconds=SAVE_FLUSH_INTERVAL)
+    async def flush_saves(self):
+        """Write out character saves queued with Character.save_deferred()."""
+        try:
+            await asyncio.to_thread(flush_pending_saves)
+        except Exception:
+            logger.exception("[SAVE FLUSH] Failed to write deferred character saves")
+
+    # ---------------------------
+    # Role Index Invalidation
+    # ---------------------------
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        invalidate_role_index(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        # Role objects are updated in place, so only a rename makes the index stale.
+        # Reordering roles fires an update per role and would otherwise rebuild it each time.
+        if before.name != after.name:
+            invalidate_role_index(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        invalidate_role_index(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        invalidate_role_index(guild.id)
+
     # ---------------------------
     # Group Definition
     # ---------------------------
@@ -37,19 +353,22 @@ class CharacterCog(commands.Cog):
         that 'Anyone with the link can edit' is enabled.
         Returns True if successful, False otherwise.
         """
-        try:
+        def write_check_cell():
             client = get_client()
             spreadsheet = client.open_by_url(url)
             worksheet = spreadsheet.get_worksheet(0)  # first worksheet
             worksheet.update_acell("A1", "ST Verification")
-            logger.debug(f"[SHEET CHECK] Successfully wrote to A1 for {url}")
+
+        try:
+            await asyncio.to_thread(write_check_cell)
+            logger.debug("[SHEET CHECK] Successfully wrote to A1 for %s", url)
             return True
 
         except gspread.exceptions.APIError as e:
-            logger.debug(f"[SHEET CHECK] APIError: {e}")
+            logger.debug("[SHEET CHECK] APIError: %s", e)
             return False
         except Exception as e:
-            logger.error(f"[SHEET CHECK] Unexpected error: {e}")
+            logger.error("[SHEET CHECK] Unexpected error: %s", e)
             return False
 
     # ---------------------------
@@ -63,8 +382,7 @@ class CharacterCog(commands.Cog):
             user_id = str(interaction.user.id)
 
             # Check if the user already has a character
-            existing_chars = list_characters_for_user(user_id) or []
-            if len(existing_chars) > 0:
+            if await asyncio.to_thread(Character.has_character, user_id):
                 await interaction.followup.send(
                     "You already have a character registered. "
                     "You must delete it before adding another.",
@@ -81,28 +399,22 @@ class CharacterCog(commands.Cog):
                 return
 
             # Build Character from sheet
-            char = Character(user_id=user_id, SHEET_URL=url)
+            char = await asyncio.to_thread(Character, user_id=user_id, SHEET_URL=url)
             char.reset_temp()
             logger.info("Character fetched from sheet")
 
             # Persist character (fail if already exists)
-            saved = char.save_parsed(update=False)
+            saved = await asyncio.to_thread(char.save_parsed, update=False)
             if saved == -1:
                 await interaction.followup.send("Character already saved!", ephemeral=True)
                 return
 
             # Nickname
-            base_username = interaction.user.name
-            playername = (char.player_name or "").strip()
-            new_nick = (
-                f"{char.name} || {base_username}"
-                if playername in ("Player Name", "")
-                else f"{char.name} || {playername}"
-            )
+            new_nick = _character_nick(char, interaction.user.name)
 
             # Starting blood entry/log
             entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _blood_timestamp(),
                 "delta": char.max_blood,
                 "comment": "Starting Blood",
                 "before": 0,
@@ -111,12 +423,10 @@ class CharacterCog(commands.Cog):
             }
             try:
                 char.curr_blood = char.max_blood
-                if not hasattr(char, "blood_log") or char.blood_log is None:
-                    char.blood_log = []
-                char.blood_log.append(entry)
-                char.save_parsed()
+                char.add_blood_entry(entry)
+                await asyncio.to_thread(char.save_parsed)
             except Exception as e:
-                logger.warning(f"Failed to write starting blood entry for {char.name}: {e}")
+                logger.warning("Failed to write starting blood entry for %s: %s", char.name, e)
 
             # Assign roles & nickname
             message = ""
@@ -125,9 +435,11 @@ class CharacterCog(commands.Cog):
                 try:
                     # Assign roles if your role assignment helper is available
                     # await assign_roles_for_character(interaction.user, char)
-                    await member.edit(nick=new_nick)
+                    await _update_nick(member, new_nick)
                 except discord.Forbidden:
                     message = "Character saved, but I don't have permission to change your nickname."
+                except Exception as e:
+                    logger.warning("Nickname update failed for %s: %s", char.name, e)
 
             # Create a default persona for this character
             try:
@@ -140,7 +452,8 @@ class CharacterCog(commands.Cog):
                 header = generate_default_header(char.to_dict() if hasattr(char, "to_dict") else char)
 
                 # DB function signature: uuid, user_id, header, keyword, image
-                create_or_update_persona(
+                await asyncio.to_thread(
+                    create_or_update_persona,
                     uuid=persona_uuid,
                     user_id=user_id,
                     header=header,
@@ -148,11 +461,12 @@ class CharacterCog(commands.Cog):
                     keyword=keyword,
                     image=None,
                 )
+                invalidate_persona_cache(user_id)
                 logger.info(
-                    f"Persona created for character {char.name} ({char.uuid}) -> Persona ID: {persona_uuid}"
+                    "Persona created for character %s (%s) -> Persona ID: %s", char.name, char.uuid, persona_uuid
                 )
             except Exception as e:
-                logger.error(f"Failed to create persona for {getattr(char, 'uuid', '?')}: {e}")
+                logger.error("Failed to create persona for %s: %s", getattr(char, 'uuid', '?'), e)
                 await interaction.followup.send(
                     f"Character saved, but there was an error creating the persona: `{e}`",
                     ephemeral=True
@@ -180,197 +494,37 @@ class CharacterCog(commands.Cog):
     @character.command(name="show", description="See the overview of your character")
     async def show(self, interaction: discord.Interaction):
         """Show details of the user's single saved character"""
-        await interaction.response.defer(ephemeral=True)
         try:
+            # ACK first: the load can wait on a save in progress for this character
+            await interaction.response.defer(ephemeral=True)
             user_id = str(interaction.user.id)
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.followup.send(
                     "You don't have a character registered yet.", ephemeral=True
                 )
                 return
 
-            # === PAGE 1 ===
-            page1 = discord.Embed(
-                title=f"{char.name or 'Unknown'}",
-                description=f"Player: {char.player_name or 'Unknown'}",
-                color=discord.Color.dark_red(),
-            )
-            page1.add_field(name="Clan", value=char.clan or "Unknown", inline=True)
-            page1.add_field(name="Generation", value=str(char.generation or "?"), inline=True)
-            page1.add_field(name="Sect", value=char.sect or "Unknown", inline=True)
-
-            page1.add_field(name="Concept", value=char.concept or "Unknown", inline=False)
-            page1.add_field(
-                name="Nature / Demeanor",
-                value=f"{char.nature or '?'} / {char.demeanor or '?'}",
-                inline=False,
-            )
-
-            page1.add_field(
-                name="Willpower",
-                value=f"{char.curr_willpower}/{char.max_willpower}",
-                inline=True,
-            )
-            page1.add_field(name="\u200b", value="\u200b", inline=True)
-            page1.add_field(
-                name="Blood Pool",
-                value=f"{char.curr_blood}/{char.max_blood} (Per Turn: {char.blood_per_turn})",
-                inline=True,
-            )
-
-            # Attributes
-            if char.attributes and len(char.attributes) >= 9:
-                physical = char.attributes[0:3]
-                social = char.attributes[3:6]
-                mental = char.attributes[6:9]
-
-                def format_attr_block(block):
-                    return "\n".join(f"**{a['name']}** {a['value']}" for a in block)
-
-                page1.add_field(name="Physical", value=format_attr_block(physical), inline=True)
-                page1.add_field(name="Social", value=format_attr_block(social), inline=True)
-                page1.add_field(name="Mental", value=format_attr_block(mental), inline=True)
-
-            # Abilities
-            ability_order = [
-                ("Talents", "Talents"),
-                ("Skills", "Skills"),
-                ("Knowledges", "Knowledges"),
-                ("Hobby Talents", "Hobby Talents"),
-                ("Professional Skill", "Professional Skill"),
-                ("Expert Knowledge", "Expert Knowledge"),
-            ]
-
-            def format_abilities(cat):
-                if not hasattr(char, "abilities") or cat not in char.abilities:
-                    return None
-                entries = [f"**{a['name']}** {a['value']}" for a in char.abilities[cat] if a['value'] > 0]
-                return "\n".join(entries) if entries else None
-
-            for cat, display in ability_order:
-                text = format_abilities(cat)
-                page1.add_field(name=display, value=text or "—", inline=True)
-
-            page1.set_footer(text=f"User: {interaction.user.display_name}")
-
-            # === PAGE 2 ===
-            page2 = discord.Embed(
-                title=f"{char.name or 'Unknown'}",
-                description="Disciplines, Backgrounds, Merits, Flaws, Virtues, Path",
-                color=discord.Color.dark_red(),
-            )
-
-            if char.disciplines:
-                disc_text = "\n".join(f"**{d['name']}** {d['value']}" for d in char.disciplines)
-                page2.add_field(name="Disciplines", value=disc_text[:1024], inline=False)
-
-            if char.backgrounds:
-                back_text = "\n".join(f"**{b['name']}** {b['value']}" for b in char.backgrounds)
-                page2.add_field(name="Backgrounds", value=back_text[:1024], inline=True)
-
-            if char.merits:
-                merits_text = "\n".join(f"{m['name'].split('(')[0]} ({m['rating']}pt)" for m in char.merits)
-                page2.add_field(name="Merits", value=merits_text[:1024], inline=True)
-
-            if char.flaws:
-                flaws_text = "\n".join(f"{f['name'].split('(')[0]} ({f['rating']}pt)" for f in char.flaws)
-                page2.add_field(name="Flaws", value=flaws_text[:1024], inline=True)
-
-            if hasattr(char, "virtues") and char.virtues:
-                virtues_text = "\n".join(f"**{v['name']}** {v['value']}" for v in char.virtues)
-                page2.add_field(name="Virtues", value=virtues_text, inline=True)
-
-            if hasattr(char, "path") and char.path:
-                page2.add_field(
-                    name="Path",
-                    value=f"**{char.path['name']}** {char.path['value']}",
-                    inline=True,
-                )
-
-            page2.set_footer(text=f"User: {interaction.user.display_name}")
-
-            # === PAGE 3 ===
-            has_rituals = hasattr(char, "rituals") and bool(char.rituals)
-            has_paths = hasattr(char, "magic_paths") and any((p.get('level') or 0) != 0 for p in (char.magic_paths or []))
-            page3 = None
-
-            if has_rituals or has_paths:
-                page3 = discord.Embed(
-                    title=f"{char.name or 'Unknown'}",
-                    description="Rituals & Sorcery Paths",
-                    color=discord.Color.dark_red(),
-                )
-
-                if has_paths:
-                    paths_text = "\n".join(
-                        f"**{p['name'].split('(')[0]}** {p['level']}" for p in char.magic_paths if p['level'] != 0
-                    )
-                    page3.add_field(name="Paths", value=paths_text[:1024], inline=False)
-
-                if has_rituals:
-                    all_sorc = [r.get('sorc_type', 'Rituals') for r in char.rituals]
-                    sorc_types = sorted(set(all_sorc))
-
-                    for sorc in sorc_types:
-                        rituals = [r for r in char.rituals if r.get('sorc_type') == sorc]
-                        rituals.sort(key=lambda r: r.get('level', 0))
-
-                        rituals_text = "\n".join(
-                            f"{r.get('name', 'Unknown')} _(Lvl {r.get('level', '?')})_"
-                            for r in rituals
-                        )
-                        if len(rituals_text) > 1024:
-                            rituals_text = rituals_text[:1021] + "..."
-
-                        page3.add_field(
-                            name=f"{sorc} Rituals",
-                            value=rituals_text or "None available.",
-                            inline=False
-                        )
-                else:
-                    page3.add_field(name="Rituals", value="None available.", inline=False)
-
-                page3.set_footer(text=f"User: {interaction.user.display_name}")
-
-            # === PAGINATION VIEW ===
-            class CharacterView(discord.ui.View):
-                def __init__(self, has_page3: bool):
-                    super().__init__(timeout=120)
-                    self.has_page3 = has_page3
-
-                @discord.ui.button(label="Page 1", style=discord.ButtonStyle.primary, disabled=True)
-                async def page1_button(self, i2: discord.Interaction, b: discord.ui.Button):
-                    self.page1_button.disabled = True
-                    self.page2_button.disabled = False
-                    if self.has_page3 and hasattr(self, "page3_button"):
-                        self.page3_button.disabled = False
-                    await i2.response.edit_message(embed=page1, view=self)
-
-                @discord.ui.button(label="Page 2", style=discord.ButtonStyle.primary)
-                async def page2_button(self, i2: discord.Interaction, b: discord.ui.Button):
-                    self.page1_button.disabled = False
-                    self.page2_button.disabled = True
-                    if self.has_page3 and hasattr(self, "page3_button"):
-                        self.page3_button.disabled = False
-                    await i2.response.edit_message(embed=page2, view=self)
-
-                if has_rituals or has_paths:
-                    @discord.ui.button(label="Page 3", style=discord.ButtonStyle.primary)
-                    async def page3_button(self, i2: discord.Interaction, b: discord.ui.Button):
-                        self.page1_button.disabled = False
-                        self.page2_button.disabled = False
-                        self.page3_button.disabled = True
-                        await i2.response.edit_message(embed=page3, view=self)
-
-            view = CharacterView(page3 is not None)
+            # Reuse pages rendered for this character revision; otherwise build them
+            # in a worker thread
+            footer_name = interaction.user.display_name
+            key = (char.uuid, char.rev, footer_name)
+            pages = _page_cache.get(key)
+            if pages is None:
+                pages = await asyncio.to_thread(_build_character_pages, char, footer_name)
+                _page_cache.set(key, pages)
+            page1, page2, page3 = pages
+
+            view = CharacterView(page1, page2, page3)
             await interaction.followup.send(embed=page1, view=view, ephemeral=True)
 
         except Exception as e:
             logger.exception("Error showing character")
-            await interaction.followup.send(
-                f"There was an error: `{type(e).__name__}: {e}`", ephemeral=True
-            )
+            message = f"There was an error: `{type(e).__name__}: {e}`"
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
 
     # ---------------------------
     # Resync Character
@@ -380,7 +534,7 @@ class CharacterCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         try:
             user_id = str(interaction.user.id)
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.followup.send(
                     "You don't have a character to resync.", ephemeral=True
@@ -390,40 +544,34 @@ class CharacterCog(commands.Cog):
             # Store old name before refetching
             old_name = char.name
 
-            # Refresh character data (pulls in the new name)
-            char.refetch_data()
+            # Refresh character data (pulls in the new name); resync is an explicit
+            # "read my sheet now", so it bypasses the short-lived sheet cache
+            await char.refetch_data_async(force=True)
 
             # Update nickname
-            base_username = interaction.user.name
-            playername = (char.player_name or "").strip()
-            new_nick = (
-                f"{char.name} || {base_username}"
-                if playername in ("Player Name", "")
-                else f"{char.name} || {playername}"
-            )
+            new_nick = _character_nick(char, interaction.user.name)
 
             member = interaction.user
             if isinstance(member, discord.Member):
                 try:
-                    await member.edit(nick=new_nick)
+                    await _update_nick(member, new_nick)
                 except discord.Forbidden:
                     await interaction.followup.send(
                         "Character resynced, but I don't have permission to change your nickname.",
                         ephemeral=True
                     )
-
-            # Update linked persona name if it matches the old character name
-            try:
-                update_persona_name_by_old_name(user_id, old_name, char.name)
-            except Exception as e:
-                logger.warning(f"Persona name update failed: {e}")
+                except Exception as e:
+                    logger.warning("Nickname update failed during resync: %s", e)
 
             # Reassign roles if needed
+            # await assign_roles_for_character(interaction.user, char)
+
+            # Update linked persona name if it matches the old character name
             try:
-                # await assign_roles_for_character(interaction.user, char)
-                pass
+                await asyncio.to_thread(update_persona_name_by_old_name, user_id, old_name, char.name)
+                invalidate_persona_cache(user_id)
             except Exception as e:
-                logger.warning(f"Role assignment failed during resync: {e}")
+                logger.warning("Persona name update failed: %s", e)
 
             await interaction.followup.send("Resynced successfully!", ephemeral=True)
 
@@ -446,7 +594,7 @@ class CharacterCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         user_id = str(interaction.user.id)
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.followup.send("You don't have a character registered yet.", ephemeral=True)
                 return
@@ -455,7 +603,7 @@ class CharacterCog(commands.Cog):
             after = max(0, min(char.max_blood, before + amount))
 
             entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _blood_timestamp(),
                 "delta": f"{'+' if amount > 0 else ''}{amount}",
                 "comment": reason or "Manual Adjustment",
                 "before": before,
@@ -464,10 +612,9 @@ class CharacterCog(commands.Cog):
             }
 
             char.curr_blood = after
-            if not hasattr(char, "blood_log") or char.blood_log is None:
-                char.blood_log = []
-            char.blood_log.append(entry)
-            char.save_parsed()
+            char.add_blood_entry(entry)
+            # Written out by the flush_saves loop; frequent adjustments coalesce
+            char.save_deferred()
 
             await interaction.followup.send(
                 f"Blood adjusted by {amount}. Current pool: {after}/{char.max_blood}.",
@@ -475,7 +622,7 @@ class CharacterCog(commands.Cog):
             )
 
         except Exception as e:
-            logger.exception(f"[ADJUST BLOOD] Error for {user_id}: {e}")
+            logger.exception("[ADJUST BLOOD] Error for %s: %s", user_id, e)
             await interaction.followup.send(f"Error adjusting blood: {e}", ephemeral=True)
 
 
@@ -490,59 +637,28 @@ class CharacterCog(commands.Cog):
     )
     async def hunt(self, interaction: discord.Interaction, roll_str: str, difficulty: int = 6, comment: str = "Hunting"):
         """Perform a hunting roll; gain blood equal to successes."""
-        from libs.roller import process_willpower, resolve_dice_pool, roll_dice, build_roll_embed
+        from libs.roller import perform_roll, VALID_ROLL_RE
         await interaction.response.defer()
 
         user_id = str(interaction.user.id)
+        if not VALID_ROLL_RE.fullmatch(roll_str or ""):
+            await interaction.followup.send("Invalid dice expression. Check syntax or traits.", ephemeral=True)
+            return
+
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.followup.send("You don't have a character registered yet.", ephemeral=True)
                 return
 
-            # Expand any macros defined on the character
-            macros = getattr(char, "macros", {}) or {}
-            expanded_str = roll_str
-            for macro_name, macro_value in macros.items():
-                if macro_name.lower() in expanded_str.lower():
-                    expanded_str = expanded_str.replace(macro_name, macro_value)
-
-            # Process Willpower if present
-            expanded_str, wp_used = process_willpower(expanded_str, char)
-
-            # Resolve pool
-            total_pool, spec_used, specs_applied = resolve_dice_pool(expanded_str, char)
-            if total_pool == -1:
+            result = await perform_roll(interaction, char, roll_str, difficulty, comment)
+            if result is None:
                 await interaction.followup.send(
                     "Invalid dice expression. Check syntax or traits.",
                     ephemeral=True
                 )
                 return
-
-            # Roll dice
-            formatted, successes, botch, ones_count = roll_dice(total_pool, spec_used, difficulty, return_ones=True)
-
-            # Apply WP success if used
-            if wp_used:
-                if ones_count > 0:
-                    ones_count -= 1
-                else:
-                    successes += 1
-                    formatted.append("*WP*")
-
-            # Build roll embed
-            embed = build_roll_embed(
-                interaction,
-                total_pool,
-                difficulty,
-                successes,
-                botch,
-                formatted,
-                specs_applied,
-                expanded_str,
-                comment,
-                wp_used
-            )
+            embed, _, successes, _ = result
 
             # Apply results to blood pool
             gained = max(0, successes)
@@ -550,7 +666,7 @@ class CharacterCog(commands.Cog):
             after = min(char.max_blood, before + gained)
 
             entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _blood_timestamp(),
                 "delta": f"+{gained}",
                 "comment": f"Hunt Roll ({roll_str})",
                 "before": before,
@@ -559,10 +675,8 @@ class CharacterCog(commands.Cog):
             }
 
             char.curr_blood = after
-            if not hasattr(char, "blood_log") or char.blood_log is None:
-                char.blood_log = []
-            char.blood_log.append(entry)
-            char.save_parsed()
+            char.add_blood_entry(entry)
+            await asyncio.to_thread(char.save_parsed)
 
             # Add blood info to embed
             embed.add_field(
@@ -574,7 +688,7 @@ class CharacterCog(commands.Cog):
             await interaction.followup.send(embed=embed)
 
         except Exception as e:
-            logger.exception(f"[HUNT] Error for {user_id}: {e}")
+            logger.exception("[HUNT] Error for %s: %s", user_id, e)
             await interaction.followup.send(f"Error during hunt: {e}", ephemeral=True)
 
 
@@ -582,65 +696,58 @@ class CharacterCog(commands.Cog):
     # Blood Log Viewer
     # ---------------------------
     @character.command(name="blood-log", description="View your character's blood pool log.")
-    async def blood_log(self, interaction: discord.Interaction):
-        """Display a formatted log of all blood changes."""
+    @app_commands.describe(
+        page="0 (default) for the current log; 1, 2, ... for older archived entries"
+    )
+    async def blood_log(self, interaction: discord.Interaction, page: app_commands.Range[int, 0] = 0):
+        """Display a formatted log of blood changes, or a page of the archived log."""
         await interaction.response.defer(ephemeral=True)
         user_id = str(interaction.user.id)
 
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.followup.send("You don't have a character registered yet.", ephemeral=True)
                 return
 
-            log_entries = getattr(char, "blood_log", []) or []
-            embed = discord.Embed(
-                title=f"Blood Log — {char.name}",
-                description=f"**Current Blood:** {char.curr_blood}/{char.max_blood}",
-                color=discord.Color.dark_red()
-            )
-            embed.set_footer(text="Most recent entries last")
-
-            if not log_entries:
-                embed.add_field(name="No Entries", value="No blood log entries yet.", inline=False)
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-
-            # Sort oldest → newest
-            sorted_log = sorted(log_entries, key=lambda x: x.get("timestamp", ""), reverse=False)
-
-            header = f"{'Date':<12} | {'Δ':<5} | {'Result':<6} | {'Reason':<18}"
-            separator = "-" * len(header)
-            lines = [header, separator]
-
-            for entry in sorted_log:
-                try:
-                    ts = datetime.fromisoformat(entry.get("timestamp", ""))
-                    formatted_date = ts.strftime("%d/%m/%Y")
-                except Exception:
-                    formatted_date = entry.get("timestamp", "")
-                delta = entry.get("delta", "")
-                result = str(entry.get("result", ""))
-                comment = (entry.get("comment", "") or "")[:18]
-                line = f"{formatted_date:<12} | {delta:<5} | {result:<6} | {comment:<18}"
-                lines.append(line)
-
-            # Handle embed field chunking
-            table_text = "\n".join(lines)
-            while table_text:
-                if len(table_text) <= 1024:
-                    embed.add_field(name="Log", value=f"```{table_text}```", inline=False)
-                    break
-                else:
-                    split_index = table_text.rfind("\n", 0, 1024)
-                    chunk = table_text[:split_index]
-                    embed.add_field(name="Log", value=f"```{chunk}```", inline=False)
+            if page:
+                log_entries = await asyncio.to_thread(
+                    get_archived_blood_log,
+                    char.uuid,
+                    BLOOD_ARCHIVE_PAGE_SIZE,
+                    (page - 1) * BLOOD_ARCHIVE_PAGE_SIZE,
+                )
+            else:
+                log_entries = char.blood_log
+            fields = []
+            if log_entries:
+                # Entries are appended as they happen, so the log is already oldest → newest
+                lines = [BLOOD_LOG_HEADER, "-" * len(BLOOD_LOG_HEADER)]
+                lines.extend(map(_format_blood_row, log_entries))
+
+                # Split into fields that fit FIELD_LIMIT once wrapped in a code block
+                table_text = "\n".join(lines)
+                limit = FIELD_LIMIT - len("``````")
+                while len(table_text) > limit:
+                    split_index = table_text.rfind("\n", 0, limit)
+                    fields.append({"name": "Log", "value": f"```{table_text[:split_index]}```", "inline": False})
                     table_text = table_text[split_index + 1:]
-
+                fields.append({"name": "Log", "value": f"```{table_text}```", "inline": False})
+            else:
+                empty = f"No archived entries on page {page}." if page else "No blood log entries yet."
+                fields.append({"name": "No Entries", "value": empty, "inline": False})
+
+            embed = discord.Embed.from_dict({
+                "title": f"Blood Log — {char.name}",
+                "description": f"**Current Blood:** {char.curr_blood}/{char.max_blood}",
+                "color": BLOOD_LOG_COLOR,
+                "fields": fields,
+                "footer": {"text": f"Archive page {page} — most recent entries last" if page else "Most recent entries last"},
+            })
             await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            logger.exception(f"[BLOOD LOG] Error for {user_id}: {e}")
+            logger.exception("[BLOOD LOG] Error for %s: %s", user_id, e)
             await interaction.followup.send(f"Error retrieving blood log: {e}", ephemeral=True)
 
 
@@ -1,24 +1,11 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from dotenv import dotenv_values
-import re
+import asyncio
 import logging
 
-from libs.database_loader import *
 from libs.character import Character
-from libs.macro import *
-from libs.roller import (
-    process_willpower,
-    resolve_dice_pool,
-    roll_dice,
-    build_roll_embed,
-    handle_botch_mention
-)
-from libs.help import get_roll_help_embed
-
-# Load configuration
-config = dotenv_values(".env")
+from libs.roller import perform_roll, handle_botch_mention, VALID_ROLL_RE
 
 logger = logging.getLogger(__name__)
 
@@ -28,38 +15,6 @@ class Diceroller(commands.Cog):
         self.bot = bot
         logger.info("Registered Diceroller Cog")
 
-    # ---------------------------
-    # Helper: Expand macros anywhere in expression
-    # ---------------------------
-    def _expand_macro_expression(self, char: Character, roll_str: str) -> str:
-        """
-        Expand any macro names found anywhere in the expression,
-        e.g. Sword+5, Dexterity+Sword+WP, etc.
-        """
-        macros = getattr(char, "macros", {}) or {}
-        if not macros:
-            return roll_str
-
-        macro_lookup = {k.lower(): v for k, v in macros.items()}
-
-        # Normalize whitespace and split by arithmetic symbols
-        tokens = re.split(r'([+\-*/])', roll_str.replace(" ", ""))
-        expanded_tokens = []
-
-        for token in tokens:
-            t = token.strip()
-            if t in {"+", "-", "*", "/"}:
-                expanded_tokens.append(t)
-                continue
-            if t.lower() in macro_lookup:
-                expanded_tokens.append(macro_lookup[t.lower()])
-            else:
-                expanded_tokens.append(t)
-
-        expanded = "".join(expanded_tokens)
-        logger.debug(f"[MACRO EXPAND] {roll_str} → {expanded}")
-        return expanded
-
     # ---------------------------
     # /roll Command
     # ---------------------------
@@ -82,8 +37,16 @@ class Diceroller(commands.Cog):
 
         user_id = str(interaction.user.id)
 
+        # Reject malformed expressions before paying for a character load
+        if not VALID_ROLL_RE.fullmatch(roll_str or ""):
+            await interaction.followup.send(
+                "Invalid expression. Use trait or macro names, numbers, `+`/`-` and `[Specialty]`.",
+                ephemeral=True
+            )
+            return
+
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.followup.send(
                     "You don't have a character registered yet. Use `/character init` first.",
@@ -91,55 +54,14 @@ class Diceroller(commands.Cog):
                 )
                 return
 
-            # Expand macros within the expression
-            expanded_str = self._expand_macro_expression(char, roll_str)
-            logger.debug(f"[ROLL] Expression: {roll_str} → {expanded_str}")
-
-            # Handle Willpower
-            expanded_str, willpower_used = process_willpower(expanded_str, char)
-            logger.debug(f"[ROLL] Willpower used: {willpower_used}")
-
-            # Resolve total dice pool
-            total_pool, spec_used, specs_applied = resolve_dice_pool(expanded_str, char)
-            if total_pool == -1:
+            result = await perform_roll(interaction, char, roll_str, difficulty, comment)
+            if result is None:
                 await interaction.followup.send(
                     "Unable to roll this pool. Check your syntax, attributes, or macro names.",
                     ephemeral=True
                 )
                 return
-
-            # Roll dice
-            try:
-                formatted, successes, botch, ones_count = roll_dice(
-                    total_pool, spec_used, difficulty, return_ones=True
-                )
-            except Exception as e:
-                logger.error(f"[ROLL] Dice rolling failed: {e}")
-                await interaction.followup.send("Dice roll failed to execute.", ephemeral=True)
-                return
-
-            # Apply Willpower auto-success
-            if willpower_used:
-                if ones_count > 0:
-                    ones_count -= 1
-                    logger.debug("[ROLL] Willpower success canceled by a rolled 1.")
-                else:
-                    successes += 1
-                    formatted.append("*WP*")
-
-            # Build the roll result embed
-            embed = build_roll_embed(
-                interaction=interaction,
-                total_pool=total_pool,
-                difficulty=difficulty,
-                successes=successes,
-                botch=botch,
-                formatted=formatted,
-                specs_applied=specs_applied,
-                expression=expanded_str,
-                comment=comment,
-                willpower_used=willpower_used,
-            )
+            embed, total_pool, successes, botch = result
 
             await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -148,15 +70,15 @@ class Diceroller(commands.Cog):
                 await handle_botch_mention(interaction, char.name)
 
             logger.info(
-                f"[ROLL] User {interaction.user} rolled {total_pool} dice (Diff {difficulty}) "
-                f"→ {successes} succ | Botch: {botch}"
+                "[ROLL] User %s rolled %s dice (Diff %s) → %s succ | Botch: %s",
+                interaction.user, total_pool, difficulty, successes, botch,
             )
 
         except ValueError as ve:
-            logger.warning(f"[ROLL] Invalid input from user {user_id}: {ve}")
+            logger.warning("[ROLL] Invalid input from user %s: %s", user_id, ve)
             await interaction.followup.send(str(ve), ephemeral=True)
         except Exception as e:
-            logger.exception(f"[ROLL] Unexpected error for user {user_id}: {e}")
+            logger.exception("[ROLL] Unexpected error for user %s: %s", user_id, e)
             await interaction.followup.send(f"Error: {e}", ephemeral=True)
 
 
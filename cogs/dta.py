@@ -1,21 +1,156 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
+import io
 import logging
+from typing import Dict, List, Optional, Tuple
 
+from libs.cache import TTLCache
 from libs.character import Character
-from libs.help import get_dta_help_embed
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after a /dta spend before rewriting the sheet's log, so a burst
+# of spends costs one sheet write
+SHEET_WRITE_DELAY = 3
+
+# Rendered /dta log tables keyed by (character uuid, rev). Every save sets a new,
+# unique rev token, so a spend or weekly grant always re-renders and two saves
+# starting from the same state can never share an entry.
+DTA_LOG_CACHE_TTL = 600
+_dta_log_cache = TTLCache(DTA_LOG_CACHE_TTL, maxsize=1024)
+
+# Discord embed limits: per field value, fields per embed, and total characters
+FIELD_LIMIT = 1024
+FIELD_COUNT_LIMIT = 25
+EMBED_LIMIT = 6000
+
+# /dta log table layout. Every field repeats the two header lines and is wrapped in
+# a ``` fence (6 chars); rows are newline-separated, so a field fits this many rows.
+DTA_LOG_HEADER = f"{'Date':<12} | {'Δ':<6} | {'Result':<7} | {'Reason':<30}"
+# Bound once; rows fill the same columns as the header
+_dta_log_row = "{:<12} | {:<6} | {:<7} | {}".format
+DTA_LOG_WIDTH = len(DTA_LOG_HEADER)
+DTA_LOG_HEAD = f"{DTA_LOG_HEADER}\n{'-' * DTA_LOG_WIDTH}"
+DTA_LOG_ROWS_PER_FIELD = (FIELD_LIMIT - 6 + 1) // (DTA_LOG_WIDTH + 1) - 2
+DTA_LOG_TRUNCATED_FOOTER = "Most recent entries last — full log attached"
+
+
+def _render_dta_log(log_entries: List[dict]) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Format DTA log entries as a text table. Returns the whole table and the same
+    rows split into self-contained chunks that fit Discord's 1024-char fields.
+    """
+    # Entries are only ever appended with the current time (/dta spend, weekly grant),
+    # so list order is already oldest-first; write_dta_log relies on the same order.
+    rows = [None] * len(log_entries)
+    for i, entry in enumerate(log_entries):
+        # Entries carry ISO timestamps (YYYY-MM-DDTHH:MM:SS...), so the date is a slice
+        ts = entry.get("timestamp", "??")
+        if isinstance(ts, str) and len(ts) >= 10 and ts[4] == "-" and ts[7] == "-":
+            formatted_date = f"{ts[8:10]}/{ts[5:7]}/{ts[:4]}"
+        else:
+            formatted_date = str(ts)
+
+        line = _dta_log_row(
+            formatted_date,
+            entry.get("delta", ""),
+            str(entry.get("result", "")),
+            entry.get("reasoning", "")[:30],
+        )
+        # Rows are at most header width, so every chunk holds a fixed number of them
+        rows[i] = line[:DTA_LOG_WIDTH]
+
+    table_text = "\n".join([DTA_LOG_HEAD, *rows])
+    chunks = tuple(
+        "\n".join([DTA_LOG_HEAD, *rows[i:i + DTA_LOG_ROWS_PER_FIELD]])
+        for i in range(0, len(rows), DTA_LOG_ROWS_PER_FIELD)
+    )
+    return table_text, chunks
+
+
+def _rendered_dta_log(char: Character) -> Tuple[str, Tuple[str, ...]]:
+    """The character's rendered DTA log (see _render_dta_log), re-rendered only after a save."""
+    key = (char.uuid, char.rev)
+    rendered = _dta_log_cache.get(key)
+    if rendered is None:
+        rendered = _render_dta_log(char.dta_log)
+        _dta_log_cache.set(key, rendered)
+    return rendered
+
+
+async def _load_character(interaction: discord.Interaction, user_id: str) -> Optional[Character]:
+    """Load the user's character, telling them how to register one if they have none."""
+    char = await asyncio.to_thread(Character.load_for_user, user_id)
+    if not char:
+        await interaction.followup.send(
+            "You don't have a character registered yet. Use `/character init` first.",
+            ephemeral=True
+        )
+    return char
+
 
 class DTA(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # char uuid -> (latest character state, interaction) awaiting a sheet write
+        self._pending_writes: Dict[str, Tuple[Character, discord.Interaction]] = {}
+        self._write_tasks: Dict[str, asyncio.Task] = {}
+        # One sheet write per character at a time, so an older log never lands last
+        self._write_locks: Dict[str, asyncio.Lock] = {}
         logger.info("Registered DTA Cog")
 
+    async def cog_unload(self):
+        # Write out anything still waiting rather than dropping it
+        for task in self._write_tasks.values():
+            task.cancel()
+        self._write_tasks.clear()
+        for char_uuid in list(self._pending_writes):
+            await self._write_sheet_log(char_uuid)
+
+    # ---------------------------
+    # Debounced Sheet Writes
+    # ---------------------------
+    def _queue_sheet_write(self, char: Character, interaction: discord.Interaction) -> None:
+        """Schedule a write of char's DTA log, coalescing with any already queued."""
+        self._pending_writes[char.uuid] = (char, interaction)
+        if char.uuid not in self._write_tasks:
+            self._write_tasks[char.uuid] = asyncio.create_task(self._write_after_delay(char.uuid))
+
+    async def _write_after_delay(self, char_uuid: str) -> None:
+        # Hold the task slot until the write is done, then pick up anything
+        # queued while it ran, so no second task writes alongside this one
+        try:
+            await asyncio.sleep(SHEET_WRITE_DELAY)
+            while char_uuid in self._pending_writes:
+                await self._write_sheet_log(char_uuid)
+        finally:
+            self._write_tasks.pop(char_uuid, None)
+
+    async def _write_sheet_log(self, char_uuid: str) -> bool:
+        """
+        Write the latest queued state of a character's DTA log to its sheet.
+        Returns False if the write failed.
+        """
+        lock = self._write_locks.setdefault(char_uuid, asyncio.Lock())
+        async with lock:
+            # Taken under the lock: whatever was queued last is what gets written
+            pending = self._pending_writes.pop(char_uuid, None)
+            if not pending:
+                return True
+            char, interaction = pending
+            try:
+                # Sheet round-trips run in a worker thread, off the event loop
+                result = await asyncio.to_thread(char.write_dta_log, ctx=interaction)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"[DTA WRITE] Write error: {e}")
+                return False
+        return True
+
     dta = app_commands.Group(
         name="dta",
         description="All DTA related commands"
@@ -31,61 +166,45 @@ class DTA(commands.Cog):
         user_id = str(interaction.user.id)
 
         try:
-            char = Character.load_for_user(user_id)
+            char = await _load_character(interaction, user_id)
             if not char:
+                return
+
+            summary = f"**Current DTA:** {char.curr_dta}\n**Total DTA:** {char.total_dta}"
+            if not char.dta_log:
+                # Nothing to tabulate, so skip the embed
                 await interaction.followup.send(
-                    "You don't have a character registered yet. Use `/character init` first.",
+                    f"{summary}\nThis character has no DTA log entries yet.",
                     ephemeral=True
                 )
                 return
 
             embed = discord.Embed(
                 title=f"DTA Log — {char.name}",
-                description=f"**Current DTA:** {char.curr_dta}\n**Total DTA:** {char.total_dta}",
+                description=summary,
                 color=discord.Color.blurple()
             )
             embed.set_footer(text="Most recent entries last")
 
-            log_entries = getattr(char, "dta_log", []) or []
-            if not log_entries:
-                embed.add_field(
-                    name="No Entries",
-                    value="This character has no DTA log entries yet.",
-                    inline=False
-                )
-            else:
-                # Sort by timestamp ascending
-                sorted_log = sorted(log_entries, key=lambda x: x.get("timestamp", ""))
-
-                # Build table
-                header = f"{'Date':<12} | {'Δ':<6} | {'Result':<7} | {'Reason':<30}"
-                separator = "-" * len(header)
-                lines = [header, separator]
-
-                for entry in sorted_log:
-                    try:
-                        ts = datetime.fromisoformat(entry["timestamp"])
-                        formatted_date = ts.strftime("%d/%m/%Y")
-                    except Exception:
-                        formatted_date = entry.get("timestamp", "??")
-
-                    delta = entry.get("delta", "")
-                    result = str(entry.get("result", ""))
-                    reasoning = entry.get("reasoning", "")[:30]
-                    line = f"{formatted_date:<12} | {delta:<6} | {result:<7} | {reasoning}"
-                    lines.append(line)
-
-                table_text = "\n".join(lines)
-
-                # Split into chunks within Discord’s 1024-char field limit
-                while table_text:
-                    if len(table_text) <= 1024:
-                        embed.add_field(name="Log", value=f"```{table_text}```", inline=False)
-                        break
-                    split_index = table_text.rfind("\n", 0, 1024)
-                    chunk = table_text[:split_index]
-                    embed.add_field(name="Log", value=f"```{chunk}```", inline=False)
-                    table_text = table_text[split_index + 1:]
+            table_text, chunks = _rendered_dta_log(char)
+            # Newest chunks first, until the embed would break Discord's field-count
+            # or total-size limits; the full table is attached when some don't fit
+            budget = EMBED_LIMIT - len(embed) - len(DTA_LOG_TRUNCATED_FOOTER)
+            shown = []
+            for chunk in reversed(chunks):
+                size = len("Log") + len(chunk) + 6
+                if len(shown) == FIELD_COUNT_LIMIT or size > budget:
+                    break
+                shown.append(chunk)
+                budget -= size
+            for chunk in reversed(shown):
+                embed.add_field(name="Log", value=f"```{chunk}```", inline=False)
+
+            if len(shown) < len(chunks):
+                embed.set_footer(text=DTA_LOG_TRUNCATED_FOOTER)
+                log_file = discord.File(io.BytesIO(table_text.encode("utf-8")), filename="dta_log.txt")
+                await interaction.followup.send(embed=embed, file=log_file, ephemeral=True)
+                return
 
             await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -109,12 +228,8 @@ class DTA(commands.Cog):
         user_id = str(interaction.user.id)
 
         try:
-            char = Character.load_for_user(user_id)
+            char = await _load_character(interaction, user_id)
             if not char:
-                await interaction.followup.send(
-                    "You don't have a character registered yet. Use `/character init` first.",
-                    ephemeral=True
-                )
                 return
 
             if amount <= 0:
@@ -128,13 +243,10 @@ class DTA(commands.Cog):
                 )
                 return
 
-            if not hasattr(char, "dta_log"):
-                char.dta_log = []
-
             char.curr_dta -= amount
 
             entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "delta": f"-{amount}",
                 "reasoning": reason,
                 "result": char.curr_dta,
@@ -143,15 +255,11 @@ class DTA(commands.Cog):
 
             char.dta_log.append(entry)
 
-            # Handle synchronous vs async safely
-            try:
-                result = await char.write_dta_log(ctx=interaction)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.warning(f"[DTA SPEND] Write error: {e}")
+            await asyncio.to_thread(char.save_parsed)
 
-            char.save_parsed()
+            # Only once the spend is saved: write_dta_log rewrites the whole log, so
+            # only the latest state of a burst of spends needs to reach the sheet
+            self._queue_sheet_write(char, interaction)
             await interaction.followup.send(f"Spent {amount} DTA on '{reason}'. Log updated.", ephemeral=True)
             logger.info(f"[DTA SPEND] {user_id} spent {amount} DTA ({char.name}) for: {reason}")
 
@@ -168,22 +276,18 @@ class DTA(commands.Cog):
         user_id = str(interaction.user.id)
 
         try:
-            char = Character.load_for_user(user_id)
+            char = await _load_character(interaction, user_id)
             if not char:
+                return
+
+            # Write now; this also supersedes any write still queued by /dta spend
+            self._pending_writes[char.uuid] = (char, interaction)
+            if not await self._write_sheet_log(char.uuid):
                 await interaction.followup.send(
-                    "You don't have a character registered yet. Use `/character init` first.",
-                    ephemeral=True
+                    "Could not write your DTA log to the sheet. Please try again later.", ephemeral=True
                 )
                 return
 
-            # Handle sync safely for both async/sync versions
-            try:
-                result = await char.write_dta_log(ctx=interaction)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.warning(f"[DTA SYNC] Write error: {e}")
-
             await interaction.followup.send("DTA log synced successfully with the sheet.", ephemeral=True)
             logger.info(f"[DTA SYNC] Synced DTA log for {user_id} ({char.name}).")
 
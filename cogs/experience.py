@@ -1,7 +1,8 @@
 # cogs/exp.py
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict, Optional
 
 import discord
@@ -225,7 +226,7 @@ class EXP(commands.Cog):
                 if not await st_check(interaction):
                     return
 
-            char = Character.load_for_user(str(target.id))
+            char = await asyncio.to_thread(Character.load_for_user, str(target.id))
             if not char:
                 msg = f"{target.display_name} has no character." if target != viewer else "You have no character."
                 return await interaction.followup.send(msg, ephemeral=not share)
@@ -269,11 +270,11 @@ class EXP(commands.Cog):
         username = user.name
 
         try:
-            char = Character.load_for_user(str(user.id))
+            char = await asyncio.to_thread(Character.load_for_user, str(user.id))
             if not char:
                 return await interaction.followup.send("You don't have a character yet. Use `/character init` first.", ephemeral=True)
 
-            today = _fmt_ddmmyyyy(datetime.utcnow())
+            today = _fmt_ddmmyyyy(datetime.now(timezone.utc))
 
             # Prevent same-day double claim by this user:
             last_user_gain_date = None
@@ -335,7 +336,7 @@ class EXP(commands.Cog):
 
             # Sync to Google Sheets & save
             await char.write_xp_log(interaction)
-            char.save_parsed()
+            await asyncio.to_thread(char.save_parsed)
             await interaction.followup.send("Daily XP collected (+1). Your log has been updated.", ephemeral=True)
 
         except Exception as e:
@@ -361,11 +362,11 @@ class EXP(commands.Cog):
         target_name = user.display_name
 
         try:
-            char = Character.load_for_user(str(user.id))
+            char = await asyncio.to_thread(Character.load_for_user, str(user.id))
             if not char:
                 return await interaction.followup.send(f"{target_name} does not have a character.", ephemeral=True)
 
-            today = _fmt_ddmmyyyy(datetime.utcnow())
+            today = _fmt_ddmmyyyy(datetime.now(timezone.utc))
             amt = float(amount)
             comment = reason or "Storyteller adjustment"
 
@@ -379,7 +380,7 @@ class EXP(commands.Cog):
 
             # Sync to Google Sheets & save
             await char.write_xp_log(interaction)
-            char.save_parsed()
+            await asyncio.to_thread(char.save_parsed)
 
             sign = "+" if amt >= 0 else ""
             await interaction.followup.send(
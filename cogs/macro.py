@@ -1,11 +1,11 @@
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
 
 from libs.character import Character
 from libs.macro import validate_macro
-from libs.roller import resolve_dice_pool
-from libs.help import get_macro_help_embed
+from libs.roller import resolve_dice_pool, WP_TOKEN_RE
 
 import logging
 logger = logging.getLogger(__name__)
@@ -40,7 +40,7 @@ class Macro(commands.Cog):
     ):
         user_id = str(interaction.user.id)
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.response.send_message(
                     "You don't have a character registered yet. Use `/character init` first.",
@@ -55,7 +55,7 @@ class Macro(commands.Cog):
                 )
                 return
 
-            if "+WP" in macro_str.upper():
+            if WP_TOKEN_RE.search(macro_str):
                 await interaction.response.send_message(
                     "Macros cannot contain '+WP'. Willpower must be added manually when rolling.",
                     ephemeral=True
@@ -75,10 +75,6 @@ class Macro(commands.Cog):
                 )
                 return
 
-            # Ensure macros attribute exists
-            if not isinstance(getattr(char, "macros", None), dict):
-                char.macros = {}
-
             if name in char.macros:
                 await interaction.response.send_message(
                     f"A macro named '{name}' already exists. Use `/macro update` to modify it.",
@@ -87,7 +83,7 @@ class Macro(commands.Cog):
                 return
 
             char.macros[name] = macro_str
-            char.save_parsed()
+            await asyncio.to_thread(char.save_parsed)
 
             specs_text = f" (using {', '.join(specs_applied)})" if specs_applied else ""
             await interaction.response.send_message(
@@ -117,7 +113,7 @@ class Macro(commands.Cog):
     ):
         user_id = str(interaction.user.id)
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.response.send_message(
                     "You don't have a character registered yet. Use `/character init` first.",
@@ -125,7 +121,7 @@ class Macro(commands.Cog):
                 )
                 return
 
-            if "+WP" in macro_str.upper():
+            if WP_TOKEN_RE.search(macro_str):
                 await interaction.response.send_message(
                     "Macros cannot contain '+WP'. Willpower must be added manually when rolling.",
                     ephemeral=True
@@ -145,7 +141,7 @@ class Macro(commands.Cog):
                 )
                 return
 
-            if not isinstance(getattr(char, "macros", None), dict) or name not in char.macros:
+            if name not in char.macros:
                 await interaction.response.send_message(
                     f"No existing macro named '{name}' found.",
                     ephemeral=True
@@ -153,7 +149,7 @@ class Macro(commands.Cog):
                 return
 
             char.macros[name] = macro_str
-            char.save_parsed()
+            await asyncio.to_thread(char.save_parsed)
 
             specs_text = f" (using {', '.join(specs_applied)})" if specs_applied else ""
             await interaction.response.send_message(
@@ -174,7 +170,7 @@ class Macro(commands.Cog):
     async def list_macros(self, interaction: discord.Interaction):
         user_id = str(interaction.user.id)
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.response.send_message(
                     "You don't have a character registered yet. Use `/character init` first.",
@@ -182,7 +178,7 @@ class Macro(commands.Cog):
                 )
                 return
 
-            macros = getattr(char, "macros", {}) or {}
+            macros = char.macros
             if not macros:
                 await interaction.response.send_message(
                     "You have no saved macros.",
@@ -223,7 +219,7 @@ class Macro(commands.Cog):
     async def delete_macro(self, interaction: discord.Interaction, name: str):
         user_id = str(interaction.user.id)
         try:
-            char = Character.load_for_user(user_id)
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
             if not char:
                 await interaction.response.send_message(
                     "You don't have a character registered yet. Use `/character init` first.",
@@ -231,12 +227,12 @@ class Macro(commands.Cog):
                 )
                 return
 
-            if not isinstance(getattr(char, "macros", None), dict) or name not in char.macros:
+            if name not in char.macros:
                 await interaction.response.send_message(f"No macro named '{name}' found.", ephemeral=True)
                 return
 
             del char.macros[name]
-            char.save_parsed()
+            await asyncio.to_thread(char.save_parsed)
 
             await interaction.response.send_message(f"Macro '{name}' deleted.", ephemeral=True)
             logger.info(f"User {user_id} deleted macro '{name}' for {char.name}.")
@@ -2,6 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import uuid as uuid_lib
+import asyncio
 import io
 import json
 import logging
@@ -12,9 +13,6 @@ from libs.database_loader import (
     update_persona_keyword,
     update_persona_image,
     delete_persona,
-    get_character_by_uuid,
-    get_character_uuid_by_name,
-    get_characters_for_user,
     execute_query,
 )
 from libs.character import Character
@@ -23,6 +21,12 @@ from libs.personas import (
     generate_default_header,
     get_persona_image,
     parse_header,
+    get_cached_personas,
+    invalidate_persona_cache,
+    match_persona_trigger,
+    persona_display_name,
+    personas_cached,
+    search_personas,
 )
 
 logger = logging.getLogger(__name__)
@@ -49,13 +53,13 @@ class Persona(commands.Cog):
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete persona UUIDs, showing header as the name."""
         user_id = str(interaction.user.id)
-        personas = list_personas_for_user(user_id)
-        results = []
-        for p in personas:
-            display_name = p.get("header") or p.get("uuid", "Unknown Persona")
-            if current.lower() in display_name.lower() or current.lower() in p["uuid"].lower():
-                results.append(app_commands.Choice(name=display_name, value=p["uuid"]))
-        return results[:25]
+        if not personas_cached(user_id):
+            # Cold cache: load from the DB off the event loop; later keystrokes hit the cache
+            await asyncio.to_thread(get_cached_personas, user_id)
+        return [
+            app_commands.Choice(name=persona_display_name(p), value=p["uuid"])
+            for p in search_personas(user_id, current)
+        ]
 
     # ===================================================
     # /persona new
@@ -75,22 +79,15 @@ class Persona(commands.Cog):
     ):
         user_id = str(interaction.user.id)
 
-        chars = get_characters_for_user(user_id)
-        if not chars:
+        char = await asyncio.to_thread(Character.load_for_user, user_id)
+        if not char:
             await interaction.response.send_message(
                 "No character found. Please set up a character first.",
                 ephemeral=True,
             )
             return
-
-        char_uuid = get_character_uuid_by_name(user_id, chars[0]["name"])
-        character_data = get_character_by_uuid(char_uuid)
-        if not character_data:
-            await interaction.response.send_message(
-                "Could not load your character data.",
-                ephemeral=True,
-            )
-            return
+        # to_dict() keeps the row-form attributes/abilities header templates expect
+        character_data = char.to_dict()
 
         header = (
             render_custom_header(header_template, character_data)
@@ -108,6 +105,7 @@ class Persona(commands.Cog):
             keyword=keyword,
             image=image_bytes,
         )
+        invalidate_persona_cache(user_id)
 
         await interaction.response.send_message(
             f"Persona created successfully.\nHeader:\n**{header}**\nUUID: `{persona_uuid}`",
@@ -128,6 +126,7 @@ class Persona(commands.Cog):
     ):
         user_id = str(interaction.user.id)
         update_persona_keyword(persona_uuid, user_id, new_keyword)
+        invalidate_persona_cache(user_id)
         await interaction.response.send_message(
             f"Persona keyword updated to `{new_keyword}`.",
             ephemeral=True,
@@ -148,6 +147,7 @@ class Persona(commands.Cog):
         user_id = str(interaction.user.id)
         image_bytes = await new_image.read()
         update_persona_image(persona_uuid, user_id, image_bytes)
+        invalidate_persona_cache(user_id)
         await interaction.response.send_message(
             "Persona image updated.",
             ephemeral=True,
@@ -169,7 +169,7 @@ class Persona(commands.Cog):
         header_template: str,
     ):
         user_id = str(interaction.user.id)
-        char = Character.load_for_user(user_id)
+        char = await asyncio.to_thread(Character.load_for_user, user_id)
 
         if not char:
             await interaction.response.send_message("No character found to render the header.", ephemeral=True)
@@ -185,6 +185,7 @@ class Persona(commands.Cog):
             (header_template, persona_uuid, user_id),
             commit=True,
         )
+        invalidate_persona_cache(user_id)
 
         rendered = render_custom_header(header_template, char.to_dict())
         await interaction.response.send_message(
@@ -205,6 +206,7 @@ class Persona(commands.Cog):
     ):
         user_id = str(interaction.user.id)
         delete_persona(persona_uuid, user_id)
+        invalidate_persona_cache(user_id)
         await interaction.response.send_message("Persona deleted.", ephemeral=True)
 
     # ===================================================
@@ -236,16 +238,13 @@ class Persona(commands.Cog):
     @persona.command(name="json", description="Export your character JSON to your DMs.")
     async def persona_json(self, interaction: discord.Interaction):
         user_id = str(interaction.user.id)
-        chars = get_characters_for_user(user_id)
-        if not chars:
+        char = await asyncio.to_thread(Character.load_for_user, user_id)
+        if not char:
             await interaction.response.send_message("No character found to export.", ephemeral=True)
             return
-
-        char_uuid = get_character_uuid_by_name(user_id, chars[0]["name"])
-        character_data = get_character_by_uuid(char_uuid)
-        if not character_data:
-            await interaction.response.send_message("Character not found.", ephemeral=True)
-            return
+        # Export the row-form view rather than the storage columns, as before
+        character_data = char.to_dict()
+        char_uuid = character_data.get("uuid")
 
         json_bytes = json.dumps(character_data, indent=4).encode("utf-8")
         file = discord.File(io.BytesIO(json_bytes), filename=f"{character_data['name']}_{char_uuid}.json")
@@ -270,48 +269,53 @@ class Persona(commands.Cog):
 
             user_id = str(message.author.id)
             content = message.content.strip()
-            personas = list_personas_for_user(user_id)
-            char = Character.load_for_user(user_id)
+            # Triggers are pre-lowered in the persona cache; the message is lowered once
+            if personas_cached(user_id):
+                match = match_persona_trigger(user_id, content)
+            else:
+                match = await asyncio.to_thread(match_persona_trigger, user_id, content)
+            if not match:
+                return
 
-            if not personas or not char:
+            char = await asyncio.to_thread(Character.load_for_user, user_id)
+            if not char:
                 return
 
-            for persona_entry in personas:
-                keyword = persona_entry.get("keyword")
-                if not keyword:
-                    continue
-
-                trigger = f"{keyword}:"
-                if content.lower().startswith(trigger.lower()):
-                    spoken_text = content[len(trigger):].strip()
-
-                    try:
-                        await message.delete()
-                    except discord.Forbidden:
-                        logger.warning("Missing permissions to delete messages.")
-
-                    header_text = parse_header(persona_entry["header"], char.to_dict()) or persona_entry["header"]
-                    full_message = f"{header_text}\n{spoken_text}"
-
-                    avatar_bytes = get_persona_image(persona_entry["uuid"])
-                    username = persona_entry.get("header", "Persona")
-
-                    try:
-                        webhook = await message.channel.create_webhook(
-                            name=username,
-                            avatar=avatar_bytes if avatar_bytes else None,
-                        )
-                        sent_msg = await webhook.send(full_message, username=username, wait=True)
-                        await webhook.delete()
-
-                        self.tupper_map[sent_msg.id] = {
-                            "user_id": user_id,
-                            "persona_name": username,
-                        }
-                    except Exception as e:
-                        logger.error(f"Failed to send persona message: {e}")
-                    break
-        except Exception as e:
+            persona_entry, spoken_text = match
+            header_text = parse_header(persona_entry["header"], char.to_dict()) or persona_entry["header"]
+            full_message = f"{header_text}\n{spoken_text}"
+
+            avatar_bytes = get_persona_image(persona_entry["uuid"])
+            username = persona_entry.get("header", "Persona")
+
+            # Deleting the trigger and creating the webhook are independent
+            # REST calls, so overlap their round-trips
+            delete_result, webhook = await asyncio.gather(
+                message.delete(),
+                message.channel.create_webhook(
+                    name=username,
+                    avatar=avatar_bytes if avatar_bytes else None,
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(delete_result, discord.Forbidden):
+                logger.warning("Missing permissions to delete messages.")
+            elif isinstance(delete_result, Exception):
+                logger.warning(f"Failed to delete persona trigger message: {delete_result}")
+
+            try:
+                if isinstance(webhook, Exception):
+                    raise webhook
+                sent_msg = await webhook.send(full_message, username=username, wait=True)
+                await webhook.delete()
+
+                self.tupper_map[sent_msg.id] = {
+                    "user_id": user_id,
+                    "persona_name": username,
+                }
+            except Exception as e:
+                logger.error(f"Failed to send persona message: {e}")
+        except Exception:
             return
 
 
@@ -1,16 +1,16 @@
-import ast
 import asyncio
 import logging
+import time
 import discord
 from discord.ext import commands
 from discord import app_commands
-from dotenv import dotenv_values
+from datetime import datetime, timezone
 
-from libs.character import *
+from libs.character import Character
+from libs.sheet_loader import get_client, fetch_sheet_values
 from libs.help import requires_st_role
 from libs.database_loader import get_all_characters
-
-config = dotenv_values(".env")
+from libs.config import config
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,49 @@ EXCLUDED_TABS = [
     "Your Blood Storage",
 ]
 
+# Max characters refreshed against Google Sheets at once during the weekly reset
+# (kept low to stay inside the Sheets API per-minute quota)
+RESET_CONCURRENCY = 8
+# Minimum seconds between progress edits of the reset response
+RESET_PROGRESS_INTERVAL = 2
+
+
+def _reset_character(char_row: dict, weekly_dta: int, st_user_id: str, interaction: discord.Interaction) -> Character:
+    """
+    Apply the weekly reset to one character and save it (blocking: DB + Google Sheets I/O).
+    The sheet is fetched first; the reset is then applied to the character's latest
+    state and saved straight away, so player changes made meanwhile are kept.
+    """
+    sheet_values = fetch_sheet_values(char_row["data"].get("SHEET_URL", ""))
+
+    def apply_reset(c: Character) -> None:
+        c.sheet_values = sheet_values
+        c.get_all_data()
+
+        # Apply weekly DTA and reset willpower
+        c.total_dta = (c.total_dta or 0) + weekly_dta
+        c.curr_dta = (c.curr_dta or 0) + weekly_dta
+        c.dta_log.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "delta": f"+{weekly_dta}",
+            "reasoning": "Weekly DTA Gain",
+            "result": c.curr_dta,
+            "user": st_user_id,
+        })
+        c.reset_willpower()
+
+    c = Character.update_latest(char_row["uuid"], char_row["user_id"], apply_reset)
+    if c is None:
+        raise ValueError("Character no longer exists")
+
+    # The grant is saved; a failed sheet write must not fail the reset (a re-run
+    # would grant the DTA twice). /dta sync rewrites the sheet's log later.
+    try:
+        c.write_dta_log(interaction)
+    except Exception as e:
+        logger.warning(f"[RESET] DTA log sheet write failed for {c.name}: {e}")
+    return c
+
 
 class ST(commands.Cog):
     def __init__(self, bot):
@@ -129,38 +172,47 @@ class ST(commands.Cog):
         """Reset all characters (requires ST role)"""
         await interaction.response.defer()
         output_data = []
+        failed = []
 
         try:
-            chars = get_all_characters()
+            chars = await asyncio.to_thread(get_all_characters)
             weekly_dta = int(config.get("WEEKLY_DTA", 0))
-
-            for char in chars:
-                c = Character(str_uuid=char["uuid"], user_id=char["user_id"], use_cache=True)
-
-                # Apply weekly DTA and reset willpower
-                c.total_dta = (c.total_dta or 0) + weekly_dta
-                c.curr_dta = (c.curr_dta or 0) + weekly_dta
-
-                entry = {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "delta": f"+{weekly_dta}",
-                    "reasoning": "Weekly DTA Gain",
-                    "result": c.curr_dta,
-                    "user": str(interaction.user.id),
-                }
-
-                c.dta_log.append(entry)
-                c.refetch_data()
-                c.reset_willpower()
-
-                # Run blocking Google Sheets write in a thread
-                await asyncio.to_thread(c.write_dta_log, interaction)
-
-                c.save_parsed()
+            st_user_id = str(interaction.user.id)
+
+            # Each reset is blocking Sheets/DB I/O: run them in worker threads, bounded
+            sem = asyncio.Semaphore(RESET_CONCURRENCY)
+            total = len(chars)
+            done = 0
+            last_progress = time.monotonic()
+
+            async def reset_one(char_row: dict) -> Character:
+                nonlocal done, last_progress
+                async with sem:
+                    try:
+                        return await asyncio.to_thread(_reset_character, char_row, weekly_dta, st_user_id, interaction)
+                    finally:
+                        done += 1
+                        now = time.monotonic()
+                        if done < total and now - last_progress >= RESET_PROGRESS_INTERVAL:
+                            last_progress = now
+                            try:
+                                await interaction.edit_original_response(
+                                    content=f"Resetting characters... {done}/{total}"
+                                )
+                            except discord.HTTPException as e:
+                                logger.debug(f"[RESET] Progress update failed: {e}")
+
+            results = await asyncio.gather(*(reset_one(row) for row in chars), return_exceptions=True)
+
+            for row, result in zip(chars, results):
+                if isinstance(result, Exception):
+                    logger.error(f"[RESET] Failed to reset {row.get('name') or row['uuid']}: {result}")
+                    failed.append(f"- **{row.get('name') or 'Unknown'}** (<@{row['user_id']}>)")
+                    continue
 
                 # Build line with character name and mention
-                user_mention = f"<@{c.user_id}>"
-                output_data.append(f"- **{c.name}** ({user_mention})")
+                user_mention = f"<@{result.user_id}>"
+                output_data.append(f"- **{result.name}** ({user_mention})")
 
             # Build announcement message
             char_list_text = "\n".join(output_data) if output_data else "No characters found."
@@ -170,8 +222,11 @@ class ST(commands.Cog):
                 f"The following characters have gained **{weekly_dta} weekly DTA**:\n\n"
                 f"{char_list_text}"
             )
+            if failed:
+                message += "\n\nThe following characters could not be reset:\n" + "\n".join(failed)
 
-            await interaction.followup.send(message)
+            # Replaces the progress text in the deferred response
+            await interaction.edit_original_response(content=message)
 
         except Exception as e:
             logger.exception(f"[RESET] Error during weekly reset: {e}")
@@ -192,16 +247,18 @@ class ST(commands.Cog):
                 await interaction.followup.send("BASE_SHEET is not configured in .env", ephemeral=True)
                 return
 
-            client = get_client()
-            base_spreadsheet = client.open_by_url(base_url)
-            base_worksheets = base_spreadsheet.worksheets()
+            client = await asyncio.to_thread(get_client)
+            base_spreadsheet = await asyncio.to_thread(client.open_by_url, base_url)
+            base_worksheets = await asyncio.to_thread(base_spreadsheet.worksheets)
             logger.info(f"[SHEETS] Loaded base sheet with {len(base_worksheets)} tabs")
 
-            characters = get_all_characters()
+            characters = await asyncio.to_thread(get_all_characters)
             updated_count = 0
 
             for char_data in characters:
-                char = Character(str_uuid=char_data["uuid"], user_id=char_data["user_id"], use_cache=True)
+                char = await asyncio.to_thread(
+                    Character, str_uuid=char_data["uuid"], user_id=char_data["user_id"], use_cache=True
+                )
                 sheet_url = char.SHEET_URL
                 if not sheet_url:
                     logger.warning(f"[SHEETS] No sheet URL for character {char.name}")
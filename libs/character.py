@@ -1,33 +1,35 @@
+import asyncio
 import logging
-import json
+import re
 import sqlite3
+import itertools
+import threading
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
 
 import discord
 import gspread
 import gspread.utils
+import orjson
 from google.oauth2.service_account import Credentials  # noqa: F401  # (kept for external get_client impl)
 
 from libs.database_loader import (
-    save_character_json,
+    save_character_rows,
     load_character_json,
+    get_character_json_for_user,
     list_characters_for_user,
 )
-from libs.sheet_loader import get_client
+from libs.sheet_loader import get_client, fetch_sheet_values
+from libs.cache import TTLCache
 
 # --------------------------------------------------------------------------------------
 # Logging Setup
 # --------------------------------------------------------------------------------------
+# Handlers/levels are configured once by bot.py
 logger = logging.getLogger(__name__)
 
-# If your app sets up logging globally elsewhere, you can comment out basicConfig below.
-logging.basicConfig(
-    level=logging.INFO,  # change to logging.DEBUG for more detail
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
-
 # --------------------------------------------------------------------------------------
 # Constants / Tables
 # --------------------------------------------------------------------------------------
@@ -49,6 +51,122 @@ blood_gen = {
     4: {"max_blood": 50, "bpt": 10},
 }
 
+# Per-user cache of persisted character JSON: user_id -> data_json.
+# The JSON text is cached (not Character objects) so a caller mutating its copy
+# can never leak unsaved state into another command.
+CHARACTER_CACHE_TTL = 60  # seconds
+_character_cache = TTLCache(CHARACTER_CACHE_TTL)
+
+
+# Blood log entries kept inside the character record; older ones are archived
+BLOOD_LOG_LIMIT = 200
+
+# Write-behind buffer for frequent small updates (see save_deferred): user_id ->
+# (save seq, (uuid, user_id, data_json), blood log entries the row trimmed off).
+# Written out by flush_pending_saves.
+_pending_saves: Dict[str, Tuple[int, Tuple[str, str, str], List[Tuple[str, str, Dict]]]] = {}
+
+# Loads, saves and flushes of a user's character state run under that user's lock,
+# so a flush can never commit a popped row on top of a newer direct save, while
+# different users never wait on each other. _save_seq numbers every save; a
+# Character remembers the number its state was loaded at (_loaded_seq), so a save
+# can tell whether a queued deferred save came after that load.
+_save_locks: Dict[str, threading.RLock] = {}
+_save_locks_guard = threading.Lock()
+_save_seq = itertools.count(1)
+
+
+def _save_lock(user_id: str) -> threading.RLock:
+    """The lock guarding user_id's character state (one per user, kept for reuse)."""
+    with _save_locks_guard:
+        lock = _save_locks.get(user_id)
+        if lock is None:
+            lock = _save_locks[user_id] = threading.RLock()
+        return lock
+
+
+def _next_save_seq() -> int:
+    """Next save sequence number; later than every number handed out so far."""
+    return next(_save_seq)
+
+
+def _base_seq(user_id: str, includes_pending: bool) -> int:
+    """
+    Sequence number for a state just loaded (call with the user's save lock held).
+    State read from the DB does not include a queued deferred save, so it counts as older.
+    """
+    pending = _pending_saves.get(user_id)
+    if pending and not includes_pending:
+        return pending[0] - 1
+    return _next_save_seq()
+
+
+def flush_pending_saves() -> int:
+    """
+    Write every deferred save to the parsed DB in one transaction (blocking).
+    Returns the number of characters written. On failure the entries are re-queued.
+    """
+    user_ids = sorted(_pending_saves)
+    if not user_ids:
+        return 0
+    with ExitStack() as stack:
+        # Sorted order: no other path holds more than one user's lock at a time
+        for user_id in user_ids:
+            stack.enter_context(_save_lock(user_id))
+        entries = [(u, _pending_saves.pop(u)) for u in user_ids if u in _pending_saves]
+        if not entries:
+            return 0
+        try:
+            save_character_rows(
+                [row for _, (_, row, _) in entries],
+                [e for _, (_, _, archived) in entries for e in archived],
+            )
+        except Exception:
+            # No one else can save these users while their locks are held,
+            # so the entries are still the newest
+            _pending_saves.update(entries)
+            raise
+    logger.info("[Character.flush_pending_saves] Saved %s characters", len(entries))
+    return len(entries)
+
+
+# Fields a Character always has, with factories for their empty values. Records
+# loaded from the DB (bypassing __init__) are back-filled from this table, so older
+# saves missing a section still look like a freshly parsed character.
+_FIELD_DEFAULTS = {
+    "rev": int,
+    "attr_names": list,
+    "attr_values": list,
+    "attr_specs": list,
+    "ability_cols": dict,
+    "virtues": list,
+    "path": lambda: None,
+    "rituals": list,
+    "magic_paths": list,
+    "macros": dict,
+    "dta_log": list,
+    "blood_log": list,
+    "xp_log": list,
+}
+
+
+# Storage-only fields: to_dict() swaps the columns for the row-form attributes and
+# abilities the JSON export and header templates have always used
+_STORAGE_FIELDS = frozenset({"rev", "attr_names", "attr_values", "attr_specs", "ability_cols"})
+
+
+def _new_rev() -> str:
+    """
+    A fresh revision token for a save. Unlike a per-instance counter, two instances
+    loaded at the same revision can never save different data under the same rev.
+    """
+    return uuid.uuid4().hex
+
+
+def _to_json(data: dict) -> str:
+    """Serialize persisted character data; orjson is several times faster than json here."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class Character:
     """
@@ -76,6 +194,9 @@ class Character:
         self.user_id = user_id or ""
         self.SHEET_URL = SHEET_URL
         self.last_updated: Optional[str] = None
+        # Replaced with a unique token on every save (see _new_rev), so (uuid, rev)
+        # names one saved version of the data; lets callers cache data derived from it
+        self.rev = 0
 
         # Runtime fields / counters
         self.curr_blood = 0
@@ -85,6 +206,21 @@ class Character:
         self.curr_xp = 0
         self.total_xp = 0
 
+        # Attributes (parallel name/value/spec columns, see `attributes`)
+        self.attr_names: List[Optional[str]] = []
+        self.attr_values: List[int] = []
+        self.attr_specs: List[Optional[str]] = []
+
+        # Abilities per category, as {"names": [...], "values": [...], "specs": [...]}
+        self.ability_cols: Dict[str, Dict[str, List]] = {}
+
+        # Sheet sections that are optional on some sheets
+        self.virtues: List[Dict] = []
+        self.path: Optional[Dict] = None
+        self.rituals: List[Dict] = []
+        self.magic_paths: List[Dict] = []
+        self.macros: Dict[str, str] = {}
+
         # Logs
         self.dta_log: List[Dict] = []
         self.blood_log: List[Dict] = []
@@ -95,13 +231,16 @@ class Character:
 
         logger.info(self._ctx("INIT - Initializing Character"))
 
-        cached = load_character_json(self.uuid, self.user_id) if use_cache else None
+        with _save_lock(self.user_id):
+            cached = load_character_json(self.uuid, self.user_id) if use_cache else None
+            self._loaded_seq = _base_seq(self.user_id, includes_pending=False)
 
         if cached:
             logger.info(self._ctx("CACHE - Loaded parsed character from DB"))
             for k, v in cached.items():
                 setattr(self, k, v)
-            self.last_updated = datetime.utcnow().isoformat()
+            self._fill_defaults()
+            self.last_updated = datetime.now(timezone.utc).isoformat()
             logger.debug(self._ctx("CACHE - Attributes restored from DB"))
         else:
             # Validate Sheet URL early
@@ -114,10 +253,7 @@ class Character:
 
             try:
                 logger.info(self._ctx("SHEETS - Opening Google Sheet (no cache)"))
-                client = get_client()
-                spreadsheet = client.open_by_url(self.SHEET_URL)
-                worksheet = spreadsheet.get_worksheet_by_id(0)
-                self.sheet_values = worksheet.get_all_values()
+                self.sheet_values = fetch_sheet_values(self.SHEET_URL)
                 logger.info(
                     self._ctx(
                         f"SHEETS - Loaded {len(self.sheet_values)} rows from worksheet id=0"
@@ -151,6 +287,98 @@ class Character:
         name = getattr(self, "name", None) or "Unknown"
         return f"[uuid={self.uuid} user={self.user_id or 'N/A'} name={name}] {msg}"
 
+    def _fill_defaults(self) -> None:
+        """Give any missing or null field from _FIELD_DEFAULTS its empty value."""
+        for field, factory in _FIELD_DEFAULTS.items():
+            if getattr(self, field, None) is None:
+                setattr(self, field, factory())
+
+        # Older records stored macros as one "name=expr;name=expr" string; parse it
+        # into the dict the roller looks up by name, once per load
+        if isinstance(self.macros, str):
+            self.macros = dict(
+                (name.strip(), expr.strip())
+                for name, sep, expr in (p.partition("=") for p in self.macros.split(";"))
+                if sep and name.strip()
+            )
+
+    # ----------------------------------------------------------------------------------
+    # Attribute / ability columns
+    # ----------------------------------------------------------------------------------
+
+    @property
+    def attributes(self) -> List[Dict]:
+        """Row view ({name, value, specs}) over the attribute columns, for legacy callers."""
+        return [
+            {"name": n, "value": v, "specs": s}
+            for n, v, s in zip(self.attr_names, self.attr_values, self.attr_specs)
+        ]
+
+    @attributes.setter
+    def attributes(self, entries: List[Optional[Dict]]):
+        """Split row-form attributes (sheet parse or legacy DB rows) into columns."""
+        rows = [e or {} for e in (entries or [])]
+        self.attr_names = [r.get("name") for r in rows]
+        self.attr_values = [r.get("value", 0) for r in rows]
+        self.attr_specs = [r.get("specs") for r in rows]
+
+    @property
+    def abilities(self) -> Dict[str, List[Dict]]:
+        """Row view ({category: [{name, value, specs}]}) over the ability columns."""
+        return {
+            cat: [
+                {"name": n, "value": v, "specs": s}
+                for n, v, s in zip(cols["names"], cols["values"], cols["specs"])
+            ]
+            for cat, cols in self.ability_cols.items()
+        }
+
+    @abilities.setter
+    def abilities(self, categories: Dict[str, List[Optional[Dict]]]):
+        """Split row-form abilities (sheet parse or legacy DB rows) into per-category columns."""
+        self.ability_cols = {}
+        for cat, entries in (categories or {}).items():
+            rows = [e or {} for e in (entries or [])]
+            self.ability_cols[cat] = {
+                "names": [r.get("name") for r in rows],
+                "values": [r.get("value") or 0 for r in rows],
+                "specs": [r.get("specs") for r in rows],
+            }
+
+    def _macro_index(self) -> Tuple[Dict[str, str], Optional[re.Pattern]]:
+        """
+        (lowercased name -> expression, pattern matching any macro name as a whole roll term).
+        Built lazily and kept until rev changes (every save, including /macro edits).
+        """
+        cached = self.__dict__.get("_macro_index_cache")
+        if cached is None or cached[0] != self.rev:
+            macros = self.macros
+            pattern = None
+            if macros:
+                # Longest first so a name never loses to one of its own prefixes;
+                # the lookarounds limit matches to whole terms between operators
+                names = sorted(macros, key=len, reverse=True)
+                pattern = re.compile(
+                    r"(?<![^+\-*/])(?:" + "|".join(map(re.escape, names)) + r")(?![^+\-*/])",
+                    re.IGNORECASE,
+                )
+            cached = self._macro_index_cache = (
+                self.rev,
+                {k.lower(): v for k, v in macros.items()},
+                pattern,
+            )
+        return cached[1], cached[2]
+
+    @property
+    def macros_lower(self) -> Dict[str, str]:
+        """Macros keyed by lowercased name, for case-insensitive lookups."""
+        return self._macro_index()[0]
+
+    @property
+    def macro_pattern(self) -> Optional[re.Pattern]:
+        """Compiled case-insensitive match for any macro name as a whole term; None without macros."""
+        return self._macro_index()[1]
+
     # ----------------------------------------------------------------------------------
     # Refresh / Save
     # ----------------------------------------------------------------------------------
@@ -165,20 +393,23 @@ class Character:
         except ValueError:
             logger.warning(self._ctx("REFRESH - Invalid last_updated format, needs refresh"))
             return True
-        needs = datetime.utcnow() - last_dt > timedelta(minutes=max_age_minutes)
-        logger.debug(self._ctx(f"REFRESH - needs_refresh={needs} (age={(datetime.utcnow()-last_dt)})"))
+        if last_dt.tzinfo is None:
+            # Older records were stored as naive UTC
+            last_dt = last_dt.replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - last_dt
+        needs = age > timedelta(minutes=max_age_minutes)
+        logger.debug(self._ctx(f"REFRESH - needs_refresh={needs} (age={age})"))
         return needs
 
-    def refetch_data(self):
+    def refetch_data(self, save: bool = True, force: bool = False):
         """
-        Fetch fresh data from Google Sheets, parse, and save to DB.
+        Fetch fresh data from Google Sheets, parse, and save to DB
+        (unless save=False, e.g. when the caller saves it later itself).
+        force=True bypasses the short-lived sheet cache.
         """
         logger.info(self._ctx("REFETCH - Fetch fresh data from sheets"))
         try:
-            client = get_client()
-            spreadsheet = client.open_by_url(self.SHEET_URL)
-            worksheet = spreadsheet.get_worksheet_by_id(0)
-            self.sheet_values = worksheet.get_all_values()
+            self.sheet_values = fetch_sheet_values(self.SHEET_URL, force=force)
             logger.info(self._ctx(f"REFETCH - Loaded {len(self.sheet_values)} rows from sheet"))
         except Exception as e:
             logger.exception(self._ctx(f"REFETCH - Failed to refetch data: {e}"))
@@ -188,37 +419,116 @@ class Character:
             # Parse everything
             logger.info(self._ctx("PARSE - Re-parsing sheet after refetch"))
             self.get_all_data()
-            # Save parsed dict to DB
-            self.save_parsed(update=True)
-            logger.info(self._ctx("REFETCH - Re-parse complete and saved"))
+            if save:
+                # Save parsed dict to DB
+                self.save_parsed(update=True)
+            logger.info(self._ctx(f"REFETCH - Re-parse complete (saved={save})"))
         except Exception as e:
             logger.exception(self._ctx(f"REFETCH - Failed during parse/save: {e}"))
             raise
 
+    async def refetch_data_async(self, save: bool = True, force: bool = False):
+        """Awaitable refetch_data: runs the sheet fetch and parse in a worker thread."""
+        await asyncio.to_thread(self.refetch_data, save, force)
+
     def save_parsed(self, update: bool = True) -> int:
         """
         Save the current object (minus sheet_values) to the parsed DB.
         """
         try:
-            data = {k: v for k, v in self.__dict__.items() if k not in ("sheet_values",)}
-            save_character_json(self.uuid, self.user_id, data)
-            self.last_updated = datetime.utcnow().isoformat()
+            with _save_lock(self.user_id):
+                self.rev = _new_rev()
+                data_json = _to_json(self._persisted_data())
+                pending = _pending_saves.get(self.user_id)
+                newer = pending is not None and pending[0] > getattr(self, "_loaded_seq", 0)
+                # A deferred save this state includes goes out with it, archive entries too
+                archived = self._trimmed_blood_rows(None if newer else pending)
+                save_character_rows([(self.uuid, self.user_id, data_json)], archived)
+                self._saved(data_json, newer)
+            self.last_updated = datetime.now(timezone.utc).isoformat()
             logger.info(self._ctx(f"SAVE - Parsed character saved (update={update})"))
             return 0
         except Exception as e:
             logger.exception(self._ctx(f"SAVE - Failed to save parsed character: {e}"))
             raise
 
-    # ----------------------------------------------------------------------------------
-    # Static / Class loaders
-    # ----------------------------------------------------------------------------------
+    def save_deferred(self) -> None:
+        """
+        Queue this character for the next flush_pending_saves() instead of writing
+        it now. Loads through load_for_user see the queued state immediately.
+        """
+        with _save_lock(self.user_id):
+            self.rev = _new_rev()
+            data_json = _to_json(self._persisted_data())
+            archived = self._trimmed_blood_rows(_pending_saves.get(self.user_id))
+            self._loaded_seq = _next_save_seq()
+            _pending_saves[self.user_id] = (
+                self._loaded_seq, (self.uuid, self.user_id, data_json), archived
+            )
+            _character_cache.set(self.user_id, data_json)
+            self._blood_trimmed = []
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self._ctx("SAVE - Queued deferred save"))
+
+    def _trimmed_blood_rows(
+        self, pending: Optional[Tuple[int, Tuple[str, str, str], List[Tuple[str, str, Dict]]]]
+    ) -> List[Tuple[str, str, Dict]]:
+        """
+        Blood log entries to archive with this save: those still queued with the given
+        pending deferred save (if any), then the ones this character trimmed since its last save.
+        """
+        archived = list(pending[2]) if pending else []
+        archived.extend((self.uuid, self.user_id, e) for e in getattr(self, "_blood_trimmed", ()))
+        return archived
+
+    def _saved(self, data_json: str, newer_pending: bool) -> None:
+        """
+        Bookkeeping after this state was written to the DB (call with the user's save lock held).
+        A deferred save queued before this character was loaded is included in it and
+        dropped; one queued after the load is newer and stays queued (and cached).
+        """
+        if newer_pending:
+            logger.warning(self._ctx("SAVE - Newer deferred save queued since load; keeping it"))
+        else:
+            _pending_saves.pop(self.user_id, None)
+            # Write through so the next load_for_user (e.g. /dta log after /dta spend) skips the DB
+            _character_cache.set(self.user_id, data_json)
+        self._blood_trimmed = []
+        self._loaded_seq = _next_save_seq()
+
+    def _persisted_data(self) -> dict:
+        """The fields written to the parsed DB (everything but sheet_values and _private caches)."""
+        return {
+            k: v for k, v in self.__dict__.items()
+            if k != "sheet_values" and not k.startswith("_")
+        }
 
     @classmethod
-    def load_by_name(cls, name: str, user_id: str) -> Optional["Character"]:
+    def update_latest(
+        cls, uuid: str, user_id: str, update: Callable[["Character"], None]
+    ) -> Optional["Character"]:
         """
-        Load a character by name and user_id from the parsed DB only (no Sheets).
+        Load the character's latest state (queued deferred save, cache or DB), apply
+        update to it and save it, all under the user's save lock so no other save of
+        this character can land in between. Other users' loads and saves never wait.
         """
-        logger.info(f"[Character.load_by_name] user={user_id} name={name} - Loading from DB")
+        with _save_lock(user_id):
+            char = cls.load_for_user(user_id)
+            if char is None or char.uuid != uuid:
+                char = cls.load_parsed(uuid, user_id)
+            if char is None:
+                return None
+            update(char)
+            char.save_parsed()
+            return char
+
+    # ----------------------------------------------------------------------------------
+    # Static / Class loaders
+    # ----------------------------------------------------------------------------------
+
+    @staticmethod
+    def _fetch_json_by_name(name: str, user_id: str) -> Optional[str]:
+        """Return the raw persisted JSON for a character by name and user_id."""
         conn = sqlite3.connect("characters.db")
         cur = conn.cursor()
         cur.execute(
@@ -230,53 +540,103 @@ class Character:
         )
         row = cur.fetchone()
         conn.close()
+        return row[0] if row else None
 
-        if not row:
-            logger.warning(f"[Character.load_by_name] user={user_id} name={name} - Not found")
-            return None
-
+    @classmethod
+    def _from_json(cls, data_json: str, includes_pending: bool) -> Optional["Character"]:
+        """
+        Build a Character from persisted JSON, bypassing __init__ (no Sheets fetch).
+        Call with the user's save lock held; includes_pending says whether the JSON came from
+        the deferred-save queue or cache rather than the DB.
+        """
         try:
-            data = json.loads(row[0])
+            data = orjson.loads(data_json)
         except Exception as e:
-            logger.exception(f"[Character.load_by_name] Failed to decode JSON: {e}")
+            logger.exception("[Character._from_json] Failed to decode JSON: %s", e)
             return None
+        return cls._from_data(data, includes_pending)
 
-        # Bypass __init__ so we don't refetch from Sheets
+    @classmethod
+    def _from_data(cls, data: dict, includes_pending: bool) -> "Character":
+        """Build a Character from a persisted dict, bypassing __init__ (see _from_json)."""
         char = cls.__new__(cls)
         for k, v in data.items():
             setattr(char, k, v)
-        logger.info(f"[Character.load_by_name] user={user_id} name={name} - Loaded successfully (uuid={getattr(char,'uuid','?')})")
+        char._fill_defaults()
+        char._loaded_seq = _base_seq(char.user_id, includes_pending)
+        return char
+
+    @classmethod
+    def load_by_name(cls, name: str, user_id: str) -> Optional["Character"]:
+        """
+        Load a character by name and user_id from the parsed DB only (no Sheets).
+        """
+        logger.info("[Character.load_by_name] user=%s name=%s - Loading from DB", user_id, name)
+        with _save_lock(user_id):
+            data_json = cls._fetch_json_by_name(name, user_id)
+            if not data_json:
+                logger.warning("[Character.load_by_name] user=%s name=%s - Not found", user_id, name)
+                return None
+            char = cls._from_json(data_json, includes_pending=False)
+        if char:
+            logger.info("[Character.load_by_name] user=%s name=%s - Loaded successfully (uuid=%s)", user_id, name, char.uuid)
         return char
 
     @classmethod
     def load_for_user(cls, user_id: str) -> Optional["Character"]:
         """
-        Load the first listed character for a user from the parsed DB.
+        Load the first listed character for a user, served from the in-memory cache
+        when fresh and from the parsed DB otherwise.
         """
-        logger.info(f"[Character.load_for_user] user={user_id} - Listing characters")
-        names = list_characters_for_user(user_id)
-        name = names[0] if names else None
-        if not name:
-            logger.warning(f"[Character.load_for_user] user={user_id} - No characters found")
-            return None
-        logger.info(f"[Character.load_for_user] user={user_id} - Loading name={name}")
-        return cls.load_by_name(name, user_id)
+        with _save_lock(user_id):
+            pending = _pending_saves.get(user_id)
+            if pending:
+                return cls._from_json(pending[1][2], includes_pending=True)
+
+            cached = _character_cache.get(user_id)
+            if cached:
+                logger.debug("[Character.load_for_user] user=%s - Cache hit", user_id)
+                return cls._from_json(cached, includes_pending=True)
+
+            logger.info("[Character.load_for_user] user=%s - Loading from DB", user_id)
+            data_json = get_character_json_for_user(user_id)
+            if not data_json:
+                logger.warning("[Character.load_for_user] user=%s - No characters found", user_id)
+                return None
+
+            _character_cache.set(user_id, data_json)
+            return cls._from_json(data_json, includes_pending=True)
+
+    @staticmethod
+    def has_character(user_id: str) -> bool:
+        """
+        True if the user already has a character. Answered from the pending/cached
+        JSON when present so repeat checks don't hit the DB.
+        """
+        if user_id in _pending_saves or _character_cache.get(user_id):
+            return True
+        return bool(list_characters_for_user(user_id))
 
     @classmethod
     def load_parsed(cls, uuid: str, user_id: Optional[str] = None) -> Optional["Character"]:
         """
         Load from parsed DB only, without hitting Google Sheets.
         """
-        logger.info(f"[Character.load_parsed] uuid={uuid} user={user_id or 'N/A'} - Loading parsed")
-        data = load_character_json(uuid, user_id)
-        if not data:
-            logger.warning(f"[Character.load_parsed] uuid={uuid} - Not found")
-            return None
-
-        char = cls.__new__(cls)
-        for k, v in data.items():
-            setattr(char, k, v)
-        logger.info(f"[Character.load_parsed] uuid={uuid} - Loaded successfully (name={getattr(char,'name','Unknown')})")
+        logger.info("[Character.load_parsed] uuid=%s user=%s - Loading parsed", uuid, user_id or "N/A")
+        if user_id is None:
+            # The lock is per user, so find out whose character this is first
+            data = load_character_json(uuid)
+            user_id = data.get("user_id") if data else None
+            if user_id is None:
+                logger.warning("[Character.load_parsed] uuid=%s - Not found", uuid)
+                return None
+        with _save_lock(user_id):
+            data = load_character_json(uuid, user_id)
+            if not data:
+                logger.warning("[Character.load_parsed] uuid=%s - Not found", uuid)
+                return None
+            char = cls._from_data(data, includes_pending=False)
+        logger.info("[Character.load_parsed] uuid=%s - Loaded successfully (name=%s)", uuid, getattr(char, "name", "Unknown"))
         return char
 
     # ----------------------------------------------------------------------------------
@@ -465,7 +825,8 @@ class Character:
             self.get_trait(c)
             for c in ["C35", "C37", "C39", "U35", "U37", "U39", "AM35", "AM37", "AM39"]
         ]
-        logger.debug(self._ctx(f"PARSE - Attributes parsed ({len([a for a in self.attributes if a])})"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self._ctx(f"PARSE - Attributes parsed ({sum(1 for n in self.attr_names if n)})"))
 
         # Abilities
         self.abilities = {
@@ -545,12 +906,15 @@ class Character:
         """Return a JSON-safe dict representation of the character automatically."""
         result = {}
         for key, value in self.__dict__.items():
-            if key.startswith("_"):
+            if key.startswith("_") or key in _STORAGE_FIELDS:
                 continue
             if hasattr(value, "to_dict"):
                 result[key] = value.to_dict()
             else:
                 result[key] = value
+        # Header templates and exports expect the row-form attribute/ability lists
+        result["attributes"] = self.attributes
+        result["abilities"] = self.abilities
         return result
 
     def __str__(self) -> str:
@@ -669,6 +1033,19 @@ class Character:
         self.curr_willpower = self.max_willpower
         self.curr_blood = self.max_blood
 
+    def add_blood_entry(self, entry: Dict) -> None:
+        """
+        Append a blood log entry, keeping only the newest BLOOD_LOG_LIMIT entries.
+        Entries trimmed off are archived by the next save, in the same transaction
+        as the record that drops them, so none is archived twice or lost.
+        """
+        self.blood_log.append(entry)
+        overflow = len(self.blood_log) - BLOOD_LOG_LIMIT
+        if overflow <= 0:
+            return
+        self._blood_trimmed = getattr(self, "_blood_trimmed", []) + self.blood_log[:overflow]
+        del self.blood_log[:overflow]
+
     def reset_willpower(self):
         logger.info(self._ctx("STATE - Resetting current willpower to max"))
         self.curr_willpower = self.max_willpower
@@ -716,13 +1093,26 @@ class Character:
         start_row = 12
         all_row_values = []
 
+        # Resolve each distinct Discord user once (logs are written by a handful of people)
+        usernames: Dict[str, str] = {}
+        guild = ctx.guild if ctx else None
+        for user_id in {entry.get("user") for entry in self.dta_log}:
+            username = "N/A"
+            try:
+                member = guild.get_member(int(user_id)) if guild else None
+                if member:
+                    username = member.name
+            except Exception as e:
+                logger.warning(self._ctx(f"DTA - Failed to resolve member for ID {user_id}: {e}"))
+            usernames[user_id] = username
+
         for entry in self.dta_log:
             # Timestamp
             raw_ts = entry.get("timestamp")
             try:
                 ts_dt = datetime.fromisoformat(raw_ts)
             except (TypeError, ValueError):
-                ts_dt = datetime.utcnow()
+                ts_dt = datetime.now(timezone.utc)
             ts = ts_dt.strftime("%d-%m-%Y")
 
             # Parse delta sign/value
@@ -742,15 +1132,7 @@ class Character:
             sheet_value = abs(delta_value)
             comment = entry.get("reasoning", "")
 
-            # Resolve Discord member => username
-            user_id = entry.get("user")
-            username = "N/A"
-            try:
-                member = ctx.guild.get_member(int(user_id)) if ctx and ctx.guild else None
-                if member:
-                    username = member.name
-            except Exception as e:
-                logger.warning(self._ctx(f"DTA - Failed to resolve member for ID {user_id}: {e}"))
+            username = usernames[entry.get("user")]
 
             # Fill row (AF:BB → 23 columns)
             row_values = [""] * 23
@@ -796,7 +1178,7 @@ class Character:
             spreadsheet = client.open_by_url(self.SHEET_URL)
             ws = spreadsheet.worksheet("XP & Downtime Logs")
         except Exception as e:
-            logger.exception(f"XP - write_xp_log: failed to open sheet: {e}")
+            logger.exception("XP - write_xp_log: failed to open sheet: %s", e)
             return
 
         start_col = 2    # Column B
@@ -863,17 +1245,17 @@ class Character:
 
         try:
             ws.batch_clear([clear_range])
-            logger.info(f"XP - Cleared old data in {clear_range}")
+            logger.info("XP - Cleared old data in %s", clear_range)
         except Exception as e:
-            logger.warning(f"XP - Failed to clear {clear_range}: {e}")
+            logger.warning("XP - Failed to clear %s: %s", clear_range, e)
 
         # ✅ STEP 4: Write updated XP log
         update_range = f"B{start_row}:X{end_row}"
         try:
             ws.update(update_range, rows)
-            logger.info(f"XP - Wrote {len(rows)} rows to {update_range}")
+            logger.info("XP - Wrote %s rows to %s", len(rows), update_range)
         except Exception as e:
-            logger.exception(f"XP - Failed to update XP log: {e}")
+            logger.exception("XP - Failed to update XP log: %s", e)
         
     def fetch_xp_log(self):
         """
@@ -890,7 +1272,7 @@ class Character:
             ss = client.open_by_url(self.SHEET_URL)
             ws = ss.worksheet("XP & Downtime Logs")
         except Exception as e:
-            logger.exception(f"XP - fetch_xp_log: failed to open sheet: {e}")
+            logger.exception("XP - fetch_xp_log: failed to open sheet: %s", e)
             self.xp_log = []
             self.curr_xp = 0
             self.total_xp = 0
@@ -900,7 +1282,7 @@ class Character:
         try:
             all_values = ws.get_all_values()
         except Exception as e:
-            logger.exception(f"XP - fetch_xp_log: get_all_values failed: {e}")
+            logger.exception("XP - fetch_xp_log: get_all_values failed: %s", e)
             self.xp_log = []
             self.curr_xp = 0
             self.total_xp = 0
@@ -924,7 +1306,7 @@ class Character:
         try:
             data_rows = ws.get(rng)  # includes blanks as empty cells
         except Exception as e:
-            logger.exception(f"XP - fetch_xp_log: failed to get {rng}: {e}")
+            logger.exception("XP - fetch_xp_log: failed to get %s: %s", rng, e)
             self.xp_log = []
             return
 
@@ -965,5 +1347,5 @@ class Character:
                 }
             )
 
-        logger.info(f"XP - Parsed {len(xp_logs)} XP entries (curr_xp={self.curr_xp}, total_xp={self.total_xp})")
+        logger.info("XP - Parsed %s XP entries (curr_xp=%s, total_xp=%s)", len(xp_logs), self.curr_xp, self.total_xp)
         self.xp_log = xp_logs
\ No newline at end of file
@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+from dotenv import dotenv_values
+
+
+@lru_cache(maxsize=1)
+def get_config() -> dict:
+    """Parse .env once per process; later calls (and cog reloads) reuse the result."""
+    return dotenv_values(".env")
+
+
+config = get_config()
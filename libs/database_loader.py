@@ -1,6 +1,6 @@
 import sqlite3
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 DB_FILE = "characters.db"
@@ -50,6 +50,22 @@ def init_db():
         commit=True,
     )
 
+    execute_query(
+        """
+        CREATE TABLE IF NOT EXISTS blood_log_archive (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            char_uuid TEXT,
+            user_id TEXT,
+            entry TEXT
+        )
+        """,
+        commit=True,
+    )
+    execute_query(
+        "CREATE INDEX IF NOT EXISTS idx_blood_log_archive_char ON blood_log_archive (char_uuid, id)",
+        commit=True,
+    )
+
     execute_query(
         """
         CREATE TABLE IF NOT EXISTS persona (
@@ -68,16 +84,32 @@ def init_db():
 # Character Operations
 # =============================
 
-def save_character_json(uuid: str, user_id: str, data: dict) -> None:
-    """Insert or update a character entry (replaces existing if uuid matches)."""
-    execute_query(
-        """
-        REPLACE INTO parsed_characters (uuid, user_id, data, last_updated)
-        VALUES (?, ?, ?, ?)
-        """,
-        (uuid, user_id, json.dumps(data), datetime.utcnow().isoformat()),
-        commit=True,
-    )
+def save_character_rows(
+    rows: list[tuple[str, str, str]], archived: Optional[list[tuple[str, str, dict]]] = None
+) -> None:
+    """
+    Insert or update many (uuid, user_id, data_json) rows in a single transaction,
+    together with the (char_uuid, user_id, entry) blood log entries those rows
+    trimmed off, so an entry is archived exactly when the record dropping it is saved.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        with conn:
+            conn.executemany(
+                """
+                REPLACE INTO parsed_characters (uuid, user_id, data, last_updated)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(uuid, user_id, data_json, now) for uuid, user_id, data_json in rows],
+            )
+            if archived:
+                conn.executemany(
+                    "INSERT INTO blood_log_archive (char_uuid, user_id, entry) VALUES (?, ?, ?)",
+                    [(char_uuid, user_id, json.dumps(e)) for char_uuid, user_id, e in archived],
+                )
+    finally:
+        conn.close()
 
 
 def load_character_json(uuid: str, user_id: Optional[str] = None) -> Optional[dict]:
@@ -110,6 +142,16 @@ def get_character_by_json_field(user_id: str, field: str, value: str) -> Optiona
     return json.loads(row[0]) if row else None
 
 
+def get_character_json_for_user(user_id: str) -> Optional[str]:
+    """Return the raw JSON data of the user's character (one per user), or None."""
+    row = execute_query(
+        "SELECT data FROM parsed_characters WHERE user_id = ? LIMIT 1",
+        (user_id,),
+        fetchone=True,
+    )
+    return row[0] if row else None
+
+
 def list_characters_for_user(user_id: str) -> list[str]:
     """Return a list containing the user's character name (0 or 1 elements)."""
     row = execute_query(
@@ -229,6 +271,18 @@ def get_character_macros(char_id: str) -> Dict[str, str]:
     macros = data.get("macros")
     return macros if isinstance(macros, dict) else {}
 
+def get_archived_blood_log(char_uuid: str, limit: int, offset: int = 0) -> list[dict]:
+    """
+    Return one page of archived blood log entries for a character, oldest first.
+    offset counts back from the most recently archived entry.
+    """
+    rows = execute_query(
+        "SELECT entry FROM blood_log_archive WHERE char_uuid = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+        (char_uuid, limit, offset),
+        fetchall=True,
+    )
+    return [json.loads(entry) for (entry,) in reversed(rows)]
+
 # =============================
 # Persona Operations
 # =============================
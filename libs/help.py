@@ -1,9 +1,40 @@
 import discord
 import ast
+import json
+import logging
 from discord import app_commands
 
-from dotenv import dotenv_values
-config = dotenv_values(".env")
+from libs.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def parse_roles(raw_roles: str) -> tuple:
+    """
+    Parse the ROLES env value (a JSON list, Python list literal or comma-separated
+    names) into role names, in configured order and without duplicates.
+    A value that isn't a list of names (e.g. a bare number) yields no roles.
+    """
+    try:
+        roles = json.loads(raw_roles)
+    except ValueError:
+        # Single-quoted Python lists aren't JSON
+        try:
+            roles = ast.literal_eval(raw_roles)
+        except Exception:
+            roles = [r.strip() for r in raw_roles.split(",")]
+    if isinstance(roles, str):
+        roles = [roles]
+    elif not isinstance(roles, (list, tuple)):
+        # e.g. ROLES=123 parses to an int; no usable role names
+        logger.warning("[ROLES] Ignoring ROLES value %r: expected a list of role names", raw_roles)
+        return ()
+    return tuple(dict.fromkeys(r for r in roles if r and isinstance(r, str)))
+
+
+# Parsed once at import; the permission check runs on every ST command
+ST_ROLE_NAMES = parse_roles(config.get("ROLES") or "[]")
+ST_ROLES = frozenset(ST_ROLE_NAMES)
 
 # ---------------------------
 # MACRO HELP EMBED FUNCTION
@@ -371,14 +402,8 @@ def requires_st_role():
     """Custom check to ensure the user has one of the allowed ST roles."""
     async def predicate(interaction: discord.Interaction) -> bool:
         try:
-            raw_roles = config.get("ROLES", "[]")
-            try:
-                allowed_roles = ast.literal_eval(raw_roles)
-            except Exception:
-                allowed_roles = [r.strip() for r in raw_roles.split(",")]
-
-            user_roles = [r.name for r in getattr(interaction.user, "roles", [])]
-            if any(r in user_roles for r in allowed_roles):
+            user_roles = getattr(interaction.user, "roles", [])
+            if not ST_ROLES.isdisjoint(r.name for r in user_roles):
                 return True
 
             # Deny access with message
@@ -387,7 +412,7 @@ def requires_st_role():
                 ephemeral=True
             )
             return False
-        except Exception as e:
+        except Exception:
             return
 
     return app_commands.check(predicate)
\ No newline at end of file
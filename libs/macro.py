@@ -1,6 +1,7 @@
 import re
-from typing import Tuple, List, Union, Dict
-from libs.character import *
+from functools import lru_cache
+from typing import Tuple, List, Union, Dict, Optional
+from libs.character import Character
 
 # Pattern for individual tokens:
 # - NAME or NAME[Spec]
@@ -15,6 +16,17 @@ TOKEN_PATTERN = re.compile(
     re.VERBOSE,
 )
 
+# Roll expression tokenizer: signed terms like "+ Melee[Swords]" or "-2"
+ROLL_TERM_RE = re.compile(r"[+-]?\s*[^+-]+")
+# Trait name with optional [Spec] at the start of a term
+ROLL_TRAIT_RE = re.compile(r"([A-Za-z\s]+)(?:\[([^\]]+)\])?")
+
+# Macro right-hand side: split on operators (kept as tokens), then parse each term
+OPERATORS = frozenset("+-")
+OPERATOR_SPLIT_RE = re.compile(r"([+-])")
+MACRO_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+MACRO_TERM_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)(\[(.+)\])?$")
+
 
 # ------------------------------
 # Validate Expression Only
@@ -32,8 +44,7 @@ def validate_expr(expr: str) -> Tuple[bool, str]:
         return False, "Expression cannot be empty."
 
     # Split while keeping operators
-    parts = re.split(r"([+-])", expr)
-    tokens = [p.strip() for p in parts if p.strip()]
+    tokens = [p for p in map(str.strip, OPERATOR_SPLIT_RE.split(expr)) if p]
 
     if not tokens:
         return False, "Expression must contain at least one token."
@@ -51,7 +62,7 @@ def validate_expr(expr: str) -> Tuple[bool, str]:
 
     # Check operators in odd positions (+ or -)
     for i in range(1, len(tokens), 2):
-        if tokens[i] not in {"+", "-"}:
+        if tokens[i] not in OPERATORS:
             return False, f"Invalid operator '{tokens[i]}'"
 
     return True, ""
@@ -81,7 +92,7 @@ def validate_macro(macro: str) -> Tuple[bool, str]:
     if not name:
         return False, "Macro must have a name before '='."
 
-    if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", name):
+    if not MACRO_NAME_RE.match(name):
         return False, f"Invalid macro name: '{name}'."
 
     valid_expr, expr_error = validate_expr(expr)
@@ -111,14 +122,13 @@ def decompile_macro(macro: str) -> Tuple[str, List[Dict[str, Union[str, int, Dic
     name = name.strip()
     expr = expr.strip()
 
-    parts = re.split(r"([+-])", expr)
-    tokens = [p.strip() for p in parts if p.strip()]
+    tokens = [p for p in map(str.strip, OPERATOR_SPLIT_RE.split(expr)) if p]
 
     output_tokens: List[Dict] = []
     sign = 1  # start with positive by default
 
     for t in tokens:
-        if t in {"+", "-"}:
+        if t in OPERATORS:
             sign = 1 if t == "+" else -1
             continue
 
@@ -128,7 +138,7 @@ def decompile_macro(macro: str) -> Tuple[str, List[Dict[str, Union[str, int, Dic
             continue
 
         # With or without specialization
-        match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)(\[(.+)\])?$", t)
+        match = MACRO_TERM_RE.match(t)
         if match:
             base = match.group(1)
             spec = match.group(3)
@@ -141,23 +151,20 @@ def decompile_macro(macro: str) -> Tuple[str, List[Dict[str, Union[str, int, Dic
 
     return name, output_tokens
 
-def sum_macro(macro_str: str, char: Character) -> Tuple[int, bool, List[str]]:
+# ------------------------------
+# Parse Roll Terms
+# ------------------------------
+@lru_cache(maxsize=2048)
+def parse_roll_terms(expr: str) -> Optional[Tuple[Tuple[int, Optional[str], Optional[str], int], ...]]:
     """
-    Sum the values in a macro string like:
-      Dexterity+Melee[Swords]+Celerity-2
+    Tokenize a roll expression into (sign, trait_name, spec, number) terms.
+    Number terms have trait_name None. Returns None if any term is not a number or trait.
 
-    Returns:
-        (total_value: int, used_spec: bool, specs_applied: list[str])
+    Memoized on the expression text, so a macro or repeated roll string is only
+    tokenized once; the character-dependent lookups happen in sum_macro.
     """
-    if not macro_str or not isinstance(macro_str, str):
-        return -1, False, []
-
-    tokens = re.findall(r"[+-]?\s*[^+-]+", macro_str)
-    total = 0
-    used_spec = False
-    specs_applied: List[str] = []
-
-    for token in tokens:
+    terms = []
+    for token in ROLL_TERM_RE.findall(expr):
         token = token.strip()
         if not token:
             continue
@@ -171,17 +178,42 @@ def sum_macro(macro_str: str, char: Character) -> Tuple[int, bool, List[str]]:
             sign = -1
 
         # Numbers
-        if re.fullmatch(r"\d+", token):
-            total += sign * int(token)
+        if token.isdecimal():
+            terms.append((sign, None, None, int(token)))
             continue
 
         # Trait names with optional spec
-        match = re.match(r"([A-Za-z\s]+)(?:\[([^\]]+)\])?", token)
+        match = ROLL_TRAIT_RE.match(token)
         if not match:
-            return -1, False, []  # invalid token
+            return None  # invalid token
+        terms.append((sign, match.group(1).strip(), match.group(2), 0))
+
+    return tuple(terms)
 
-        trait_name = match.group(1).strip()
-        spec = match.group(2)
+
+def sum_macro(macro_str: str, char: Character) -> Tuple[int, bool, List[str]]:
+    """
+    Sum the values in a macro string like:
+      Dexterity+Melee[Swords]+Celerity-2
+
+    Returns:
+        (total_value: int, used_spec: bool, specs_applied: list[str])
+    """
+    if not macro_str or not isinstance(macro_str, str):
+        return -1, False, []
+
+    terms = parse_roll_terms(macro_str)
+    if terms is None:
+        return -1, False, []  # invalid token
+
+    total = 0
+    used_spec = False
+    specs_applied: List[str] = []
+
+    for sign, trait_name, spec, number in terms:
+        if trait_name is None:
+            total += sign * number
+            continue
 
         value, found, spec_used = get_character_value(char, trait_name, spec)
         if not found:
@@ -202,33 +234,35 @@ def get_character_value(char: Character, trait_name: str, spec: str = None) -> T
     Returns: (value, found, used_spec)
     """
     trait_name_lower = trait_name.lower()
+    spec_lower = spec.lower() if spec else None
 
-    def check_entry(entry):
-        if entry["name"].lower() != trait_name_lower:
+    def check_trait(name, value, entry_specs):
+        if not name or name.lower() != trait_name_lower:
             return None
-        if spec:
-            entry_specs = entry.get("specs")
+        if spec_lower:
             if not entry_specs:
                 return None
-            specs_list = [s.strip().lower() for s in entry_specs.split(",")]
-            if spec.lower() not in specs_list:
+            # Single pass over the comma-separated specs, stopping at the first match
+            if not any(s.strip().lower() == spec_lower for s in entry_specs.split(",")):
                 return None
-            return entry.get("value", 0), True  # used spec
-        return entry.get("value", 0), False
+            return value or 0, True  # used spec
+        return value or 0, False
 
-    # 1. Attributes
-    for entry in char.attributes:
-        res = check_entry(entry)
+    def check_entry(entry):
+        return check_trait(entry["name"], entry.get("value", 0), entry.get("specs"))
+
+    # 1. Attributes (stored as parallel columns on the character)
+    for name, value, entry_specs in zip(char.attr_names, char.attr_values, char.attr_specs):
+        res = check_trait(name, value, entry_specs)
         if res:
             return res[0], True, res[1]
 
-    # 2. Abilities
-    if hasattr(char, "abilities"):
-        for category in char.abilities.values():
-            for entry in category:
-                res = check_entry(entry)
-                if res:
-                    return res[0], True, res[1]
+    # 2. Abilities (parallel columns per category)
+    for cols in char.ability_cols.values():
+        for name, value, entry_specs in zip(cols["names"], cols["values"], cols["specs"]):
+            res = check_trait(name, value, entry_specs)
+            if res:
+                return res[0], True, res[1]
 
     # 3. Disciplines
     for entry in char.disciplines:
@@ -1,12 +1,104 @@
 import logging
 import re
+from bisect import bisect_left
+from itertools import islice
 from types import SimpleNamespace
+from typing import List, Optional, Tuple
 
-from libs.database_loader import execute_query
+from libs.cache import TTLCache
+from libs.database_loader import execute_query, list_personas_for_user
 from libs.character import Character
 
 logger = logging.getLogger(__name__)
 
+# ============================================================
+# Persona List Cache
+# ============================================================
+
+# Per-user cache of persona rows (autocomplete + keyword relay):
+# user_id -> (personas, sorted case-folded display names, personas in that order,
+#             "<name>\n<uuid>" case-folded search keys in the same order,
+#             (lowercase "keyword:" trigger, persona) pairs for the message relay)
+# The index columns are tuples: built once per refresh, never mutated.
+PERSONA_CACHE_TTL = 60  # seconds
+_persona_cache = TTLCache(PERSONA_CACHE_TTL)
+
+
+def persona_display_name(persona: dict) -> str:
+    """Name shown for a persona in pickers: its header, falling back to the UUID."""
+    return persona.get("header") or persona.get("uuid", "Unknown Persona")
+
+
+def _load_personas(
+    user_id: str,
+) -> Tuple[List[dict], Tuple[str, ...], Tuple[dict, ...], Tuple[str, ...], Tuple[Tuple[str, dict], ...]]:
+    """Return the cache entry for a user, rebuilding it (and its prefix index) when stale."""
+    cached = _persona_cache.get(user_id)
+    if cached:
+        return cached
+    personas = list_personas_for_user(user_id)
+    # Case-fold each display name once; the sort order and the keys share it
+    pairs = sorted((persona_display_name(p).casefold(), i) for i, p in enumerate(personas))
+    keys = tuple(key for key, _ in pairs)
+    ordered = tuple(personas[i] for _, i in pairs)
+    # Name and UUID in one string so the substring fallback is a single `in` per persona
+    search_keys = tuple(f"{key}\n{p['uuid'].casefold()}" for key, p in zip(keys, ordered))
+    triggers = tuple((f"{p['keyword']}:".lower(), p) for p in personas if p.get("keyword"))
+    entry = (personas, keys, ordered, search_keys, triggers)
+    _persona_cache.set(user_id, entry)
+    return entry
+
+
+def personas_cached(user_id: str) -> bool:
+    """True if a user's personas are in the cache, i.e. reading them won't touch the DB."""
+    return _persona_cache.get(user_id) is not None
+
+
+def get_cached_personas(user_id: str) -> List[dict]:
+    """Return a user's personas, hitting the DB at most once per PERSONA_CACHE_TTL."""
+    return _load_personas(user_id)[0]
+
+
+def search_personas(user_id: str, current: str, limit: int = 25) -> List[dict]:
+    """
+    Return up to `limit` personas whose display name starts with `current`
+    (bisect over the sorted index). Falls back to a substring match on the
+    display name or UUID when nothing matches as a prefix.
+    """
+    _, keys, ordered, search_keys, _ = _load_personas(user_id)
+    cur = current.casefold()
+
+    # Every key starting with `cur` sorts between cur and cur + the highest code point
+    start = bisect_left(keys, cur)
+    end = bisect_left(keys, cur + "\U0010ffff", start)
+    if end > start:
+        return list(ordered[start:min(end, start + limit)])
+
+    return list(islice((p for p, key in zip(ordered, search_keys) if cur in key), limit))
+
+
+def match_persona_trigger(user_id: str, content: str) -> Optional[Tuple[dict, str]]:
+    """
+    Return (persona, spoken text) for the first persona whose "keyword:" trigger
+    starts the message (case-insensitive), or None.
+    """
+    triggers = _load_personas(user_id)[4]
+    if not triggers:
+        return None
+    lowered = content.lower()
+    for trigger, persona in triggers:
+        if lowered.startswith(trigger):
+            return persona, content[len(trigger):].strip()
+    return None
+
+
+def invalidate_persona_cache(user_id: Optional[str] = None) -> None:
+    """Drop the cached personas for a user, or the whole cache when user_id is None."""
+    if user_id is None:
+        _persona_cache.clear()
+    else:
+        _persona_cache.pop(str(user_id), None)
+
 # ============================================================
 # Header Utilities
 # ============================================================
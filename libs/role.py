@@ -1,10 +1,65 @@
 import discord
-from discord.utils import get
 import logging
-from libs.character import *
+from typing import Dict, Optional, Tuple
+from libs.character import Character
+from libs.help import ST_ROLE_NAMES
 
 logger = logging.getLogger(__name__)
 
+# Per-guild role lookup: guild_id -> (exact name -> Role, casefolded name -> Role).
+# Built lazily from guild.roles; the role create/update/delete listeners drop it.
+_role_index: Dict[int, Tuple[Dict[str, discord.Role], Dict[str, discord.Role]]] = {}
+
+
+def get_role_index(guild: discord.Guild) -> Tuple[Dict[str, discord.Role], Dict[str, discord.Role]]:
+    """Return (and build on first use) the name -> Role maps for a guild."""
+    index = _role_index.get(guild.id)
+    if index is None:
+        exact, lowered = {}, {}
+        # setdefault keeps the first match in role order, like a linear scan would
+        for r in guild.roles:
+            exact.setdefault(r.name, r)
+            lowered.setdefault(r.name.casefold(), r)
+        index = _role_index[guild.id] = (exact, lowered)
+    return index
+
+
+def find_guild_role(guild: discord.Guild, name: str) -> Optional[discord.Role]:
+    """Find a guild role by exact name, falling back to a case-insensitive match."""
+    if not name:
+        return None
+    exact, lowered = get_role_index(guild)
+    return exact.get(name) or lowered.get(name.casefold())
+
+
+# ST role names as role index keys, in configured order
+_ST_ROLE_KEYS = tuple(name.casefold() for name in ST_ROLE_NAMES)
+
+# Per-guild mention string for the ST roles (botch alerts): guild_id -> "<@&..> <@&..>"
+_st_mentions: Dict[int, str] = {}
+
+
+def get_st_mentions(guild: discord.Guild) -> str:
+    """Return the space-joined mentions of the configured ST roles present in a guild."""
+    mentions = _st_mentions.get(guild.id)
+    if mentions is None:
+        _, lowered = get_role_index(guild)
+        mentions = _st_mentions[guild.id] = " ".join(
+            [lowered[key].mention for key in _ST_ROLE_KEYS if key in lowered]
+        )
+    return mentions
+
+
+def invalidate_role_index(guild_id: Optional[int] = None) -> None:
+    """Drop the role index (and ST mentions) for a guild, or for every guild when guild_id is None."""
+    if guild_id is None:
+        _role_index.clear()
+        _st_mentions.clear()
+    else:
+        _role_index.pop(guild_id, None)
+        _st_mentions.pop(guild_id, None)
+
+
 async def assign_roles_for_character(member: discord.Member, char: Character):
     """
     Assign clan, sect, and ranking roles to a Discord member based on their character.
@@ -19,12 +74,7 @@ async def assign_roles_for_character(member: discord.Member, char: Character):
     # Helper to find a role by name (case-insensitive)
     # -------------------------------------
     def find_role(name: str):
-        if not name:
-            return None
-        role = get(guild.roles, name=name)
-        if role:
-            return role
-        return next((r for r in guild.roles if r.name.lower() == name.lower()), None)
+        return find_guild_role(guild, name)
 
     # =========================
     # RESOLVE ROLES TO ASSIGN
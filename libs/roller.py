@@ -1,22 +1,58 @@
+import asyncio
 import re
-import ast
 import discord
 import logging
+import string
+from functools import lru_cache
+from operator import itemgetter
 from random import randint
-from typing import Tuple, List
-from libs.macro import *
-
-from dotenv import dotenv_values
-config = dotenv_values(".env")
+from typing import Tuple, List, Optional
+from libs.cache import TTLCache
+from libs.character import Character
+from libs.macro import ROLL_TERM_RE, ROLL_TRAIT_RE, sum_macro
+from libs.help import ST_ROLE_NAMES
+from libs.role import get_st_mentions
 
 
 logger = logging.getLogger(__name__)
 
+# Characters a roll string can contain: names, numbers, +/-, spaces and [spec] groups
+VALID_ROLL_RE = re.compile(r"(?:[A-Za-z0-9+\-_ ]|\[[^\]]*\])+")
+
+# Macro expansion: whitespace dropped before matching macro names, and the
+# characters a macro name can start with (see validate_macro)
+WHITESPACE_RE = re.compile(r"\s+")
+MACRO_NAME_START = frozenset(string.ascii_letters + "_")
+
+# Expanded roll strings keyed by (character uuid, rev, roll_str). Every save sets a
+# new unique rev, so edits to a character's macros never hit a stale expansion.
+EXPANSION_CACHE_TTL = 3600
+_expansion_cache = TTLCache(EXPANSION_CACHE_TTL, maxsize=4096)
+
+# Resolved dice pools keyed by (character uuid, rev, roll_str). A pool depends only
+# on the roll string and the character's saved traits and macros, and every save
+# sets a new unique rev, so an entry can never outlive the data it was resolved from
+POOL_CACHE_TTL = 3600
+_pool_cache = TTLCache(POOL_CACHE_TTL, maxsize=4096)
+
+# "+WP" willpower token, any casing
+WP_TOKEN_RE = re.compile(r"\+wp", re.IGNORECASE)
+
+# Roll embed colours, indexed by "at least one success" (successes is never negative)
+ROLL_FAIL_COLOR = discord.Color.dark_red().value
+ROLL_SUCCESS_COLOR = discord.Color.green().value
+ROLL_COLORS = (ROLL_FAIL_COLOR, ROLL_SUCCESS_COLOR)
+
+# Roll embed result titles for the success counts that actually come up
+SUCCESS_TITLES = tuple(f"{i} Success{'es' if i != 1 else ''}" for i in range(64))
+
 
 # ---------------------------
 # Dice Roller
 # ---------------------------
-def roll_dice(pool: int, spec: bool, difficulty: int, return_ones: bool = False):
+def roll_dice(
+    pool: int, spec: bool, difficulty: int, return_ones: bool = False, willpower: bool = False
+):
     """
     V20 dice roller with proper formatting and sorted results.
     - ~~strike~~: 1's and cancelled successes
@@ -25,10 +61,12 @@ def roll_dice(pool: int, spec: bool, difficulty: int, return_ones: bool = False)
     - **bold**: 10 with spec (crit)
 
     Order: sorted ascending, grouped STRIKE → ITALIC → NORMAL → CRIT
+
+    With willpower, adds one automatic success (shown as *WP*) unless a 1 was rolled.
     """
     rolls = [randint(1, 10) for _ in range(pool)]
     indexed_rolls = list(enumerate(rolls))
-    indexed_rolls.sort(key=lambda x: x[1])  # sort ascending by value
+    indexed_rolls.sort(key=itemgetter(1))  # sort ascending by value
 
     successes_idx = []
     total_successes = 0
@@ -46,7 +84,7 @@ def roll_dice(pool: int, spec: bool, difficulty: int, return_ones: bool = False)
 
     # Cancel lowest successes with 1's
     ones_idx = [i for i, v in indexed_rolls if v == 1]
-    successes_idx.sort(key=lambda x: x[1])  # cancel lowest successes first
+    successes_idx.sort(key=itemgetter(1))  # cancel lowest successes first
     to_cancel = [idx for idx, _ in successes_idx[:len(ones_idx)]]
 
     final_suxx = max(0, total_successes - len(ones_idx))
@@ -72,35 +110,63 @@ def roll_dice(pool: int, spec: bool, difficulty: int, return_ones: bool = False)
 
     formatted += normal + crit
 
+    if willpower and not ones_idx:
+        final_suxx += 1
+        formatted.append("*WP*")
+
     if return_ones:
         return formatted, final_suxx, botch, len(ones_idx)
     return formatted, final_suxx, botch
 
 
+# ---------------------------
+# Utility: Expand Macros
+# ---------------------------
+def expand_macro_expression(char: "Character", roll_str: str) -> str:
+    """
+    Expand any macro names found anywhere in the expression,
+    e.g. Sword+5, Dexterity+Sword+WP, etc.
+    """
+    macros = char.macros
+    if not macros or MACRO_NAME_START.isdisjoint(roll_str):
+        # No macros, or nothing in the string could be a macro name (e.g. "5+3")
+        return roll_str
+
+    key = (char.uuid, char.rev, roll_str)
+    expanded = _expansion_cache.get(key)
+    if expanded is not None:
+        return expanded
+
+    # One pass over the whitespace-free string, substituting whole-term macro names
+    # (exact-case name first, then case-insensitive)
+    lookup = char.macros_lower
+    expanded = char.macro_pattern.sub(
+        lambda m: macros.get(m.group(0)) or lookup[m.group(0).lower()],
+        WHITESPACE_RE.sub("", roll_str),
+    )
+    _expansion_cache.set(key, expanded)
+    logger.debug("[MACRO EXPAND] %s → %s", roll_str, expanded)
+    return expanded
+
+
 # ---------------------------
 # Utility: Handle Willpower Token
 # ---------------------------
 def process_willpower(roll_str: str, char: "Character") -> Tuple[str, bool]:
-    """Remove +WP from roll_str and spend Willpower if available"""
-    if "+WP" not in roll_str.upper():
+    """
+    Remove +WP from roll_str and spend Willpower if available.
+    Does not save: the caller persists the character off the event loop.
+    """
+    if not WP_TOKEN_RE.search(roll_str):
         return roll_str, False
 
     if char.curr_willpower < 1:
         raise ValueError(f"{char.name} does not have enough Willpower to spend!")
 
-    cleaned = (
-        roll_str.replace("+WP", "")
-        .replace("+wp", "")
-        .replace("+Wp", "")
-        .replace("+wP", "")
-        .strip()
-    )
+    cleaned = WP_TOKEN_RE.sub("", roll_str).strip()
 
     char.curr_willpower -= 1
-    char.save_parsed()
-    logger.debug(
-        f"[ROLL] Willpower spent for {char.name}. Remaining: {char.curr_willpower}"
-    )
+    logger.debug("[ROLL] Willpower spent for %s. Remaining: %s", char.name, char.curr_willpower)
     return cleaned, True
 
 
@@ -112,29 +178,46 @@ def resolve_dice_pool(roll_str: str, char: Character) -> Tuple[int, bool, List[s
 
     If roll_str matches a macro name, resolve using that macro expression.
     Otherwise, treat roll_str as a direct dice expression.
+
+    Memoized per (character uuid, rev, roll_str), so a repeated roll skips the
+    trait lookups until the character is next saved.
     """
-    macros = get_character_macros(char.uuid)
-    if roll_str in macros:
-        return sum_macro(macros[roll_str], char=char)
+    cache_key = (char.uuid, char.rev, roll_str)
+    cached = _pool_cache.get(cache_key)
+    if cached is not None:
+        total, used_spec, specs = cached
+        return total, used_spec, list(specs)
+
+    # Macro names are identifiers (see validate_macro); expressions skip the lookup.
+    # Macros are part of the loaded character; no need to re-read them from the DB
+    key = roll_str.strip()
+    macro_expr = char.macros.get(key) if key.isidentifier() else None
+    total, used_spec, specs = sum_macro(
+        macro_expr if macro_expr is not None else roll_str, char=char
+    )
 
-    return sum_macro(roll_str, char=char)
+    _pool_cache.set(cache_key, (total, used_spec, tuple(specs)))
+    return total, used_spec, specs
 
 
 # ---------------------------
 # Utility: Format String
 # ---------------------------
+@lru_cache(maxsize=512)
 def format_roll_expression(expr: str) -> str:
     """
     Convert a raw roll expression into a more human-readable string.
     Example:
         Dexterity+Melee[Swords]+4 → "Rolling Dexterity, Melee (Swords) + 4 dice"
         Strength-2               → "Rolling Strength - 2 dice"
+
+    Memoized: players repeat the same few roll strings all session.
     """
     if not expr or not isinstance(expr, str):
         return "Rolling (invalid expression)"
 
     # Split tokens by + or - but keep the sign
-    tokens = re.findall(r"[+-]?\s*[^+-]+", expr)
+    tokens = ROLL_TERM_RE.findall(expr)
     trait_parts = []
     dice_mods = []
 
@@ -150,13 +233,13 @@ def format_roll_expression(expr: str) -> str:
             token = token[1:].strip()
 
         # Numbers → dice modifiers
-        if re.fullmatch(r"\d+", token):
+        if token.isdecimal():
             mod = f"{sign} {token} dice"
             dice_mods.append(mod)
             continue
 
         # Traits with optional spec
-        m = re.match(r"([A-Za-z\s]+)(?:\[([^\]]+)\])?", token)
+        m = ROLL_TRAIT_RE.match(token)
         if m:
             name = m.group(1).strip()
             spec = m.group(2)
@@ -183,7 +266,6 @@ def format_roll_expression(expr: str) -> str:
 # Utility: Build Result Embed
 # ---------------------------
 def build_roll_embed(
-    
     interaction: discord.Interaction,
     total_pool: int,
     difficulty: int,
@@ -196,32 +278,84 @@ def build_roll_embed(
     willpower_used: bool,
 ) -> discord.Embed:
     """Create the nicely formatted roll result embed"""
-    color = discord.Color.dark_red() if successes == 0 else discord.Color.green()
-    embed = discord.Embed(
-        title=f"{interaction.user.display_name or interaction.user.name}: Pool {total_pool}, Diff {difficulty}",
-        color=color,
-    )
-
-    result_title = f"{successes} Success{'es' if successes != 1 else ''}" if not botch else "BOTCH"
-    embed.add_field(name=result_title, value=" ", inline=False)
-
-    embed.add_field(name="Dice", value=" ".join(formatted), inline=True)
-    embed.add_field(
-        name="Specialties Applied",
-        value=", ".join(specs_applied) if specs_applied else "None",
-        inline=True,
-    )
-
-    footer_string = format_roll_expression(original_str)
-    footer_value = f"-# {footer_string.strip()}"
+    if botch:
+        result_title = "BOTCH"
+    elif successes < len(SUCCESS_TITLES):
+        result_title = SUCCESS_TITLES[successes]
+    else:
+        result_title = f"{successes} Successes"
 
+    # format_roll_expression is memoized and never returns padded text
+    footer_value = f"-# {format_roll_expression(original_str)}"
     if willpower_used:
         footer_value += "; Willpower Used"
     if comment:
         footer_value += f"\n\n-# {comment}"
 
-    embed.add_field(name="", value=footer_value, inline=False)
-    return embed
+    return discord.Embed.from_dict({
+        # display_name already falls back to the username
+        "title": f"{interaction.user.display_name}: Pool {total_pool}, Diff {difficulty}",
+        "color": ROLL_COLORS[successes > 0],
+        "fields": [
+            {"name": result_title, "value": " ", "inline": False},
+            {"name": "Dice", "value": " ".join(formatted), "inline": True},
+            {
+                "name": "Specialties Applied",
+                "value": ", ".join(specs_applied) if specs_applied else "None",
+                "inline": True,
+            },
+            {"name": "", "value": footer_value, "inline": False},
+        ],
+    })
+
+
+# ---------------------------
+# Roll Pipeline (/roll, /character hunt)
+# ---------------------------
+async def perform_roll(
+    interaction: discord.Interaction,
+    char: "Character",
+    roll_str: str,
+    difficulty: int,
+    comment: Optional[str],
+) -> Optional[Tuple[discord.Embed, int, int, bool]]:
+    """
+    Expand macros, spend +WP, resolve the pool, roll and build the result embed.
+    Returns (embed, total_pool, successes, botch), or None if the pool can't be resolved.
+    Raises ValueError if +WP is used without Willpower left.
+
+    A willpower spend is saved (in a worker thread) before the pool is resolved,
+    so it sticks even when the pool then fails to resolve.
+    """
+    expanded_str = expand_macro_expression(char, roll_str)
+    logger.debug("[ROLL] Expression: %s → %s", roll_str, expanded_str)
+
+    expanded_str, willpower_used = process_willpower(expanded_str, char)
+    if willpower_used:
+        await asyncio.to_thread(char.save_parsed)
+
+    total_pool, spec_used, specs_applied = resolve_dice_pool(expanded_str, char)
+    if total_pool == -1:
+        return None
+
+    # Willpower's automatic success is applied (or cancelled by a 1) inside roll_dice
+    formatted, successes, botch = roll_dice(
+        total_pool, spec_used, difficulty, willpower=willpower_used
+    )
+
+    embed = build_roll_embed(
+        interaction=interaction,
+        total_pool=total_pool,
+        difficulty=difficulty,
+        successes=successes,
+        botch=botch,
+        formatted=formatted,
+        specs_applied=specs_applied,
+        original_str=expanded_str,
+        comment=comment,
+        willpower_used=willpower_used,
+    )
+    return embed, total_pool, successes, botch
 
 
 # ---------------------------
@@ -232,26 +366,12 @@ async def handle_botch_mention(
 ):
     """Mention storyteller roles on botch if configured"""
     try:
-        roles_env = config.get("ROLES", "[]")
-        try:
-            role_names = ast.literal_eval(roles_env)
-        except Exception:
-            logger.warning("[ROLL] ROLES env variable invalid. Using empty list.")
-            role_names = []
-
-        if not role_names:
+        if not ST_ROLE_NAMES:
             return
 
-        guild_roles = interaction.guild.roles
-        mentionable_roles = [
-            next((r for r in guild_roles if r.name.lower() == role_name.lower()), None)
-            for role_name in role_names
-        ]
-        mentionable_roles = [r for r in mentionable_roles if r is not None]
-
-        if mentionable_roles:
-            mentions = " ".join([r.mention for r in mentionable_roles])
+        mentions = get_st_mentions(interaction.guild)
+        if mentions:
             await interaction.followup.send(f"BOTCH by {char_name} — {mentions}")
 
     except Exception as e:
-        logger.exception(f"[ROLL] Error during botch mention: {e}")
+        logger.exception("[ROLL] Error during botch mention: %s", e)
@@ -1,10 +1,13 @@
 import logging
 import os
+import threading
+from typing import Dict, List, Optional
+
 import gspread
 import gspread.utils
 from google.oauth2.service_account import Credentials
 
-from libs.database_loader import *
+from libs.cache import TTLCache
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -19,12 +22,72 @@ SCOPES = [
 SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_CREDENTIALS", "credentials.json")
 
 
+# Sheet values are cached briefly per URL so back-to-back resync/reset_all runs
+# don't spend Google's per-user read quota on the same sheet twice
+SHEET_CACHE_TTL = 30
+_sheet_cache = TTLCache(SHEET_CACHE_TTL, maxsize=256)
+# url -> [fetch lock, number of callers holding or waiting on it]; an entry lives
+# only while it has callers
+_fetch_locks: Dict[str, list] = {}
+_fetch_locks_guard = threading.Lock()
+
+_client: Optional[gspread.Client] = None
+_client_lock = threading.Lock()
+
+
 def get_client() -> gspread.Client:
     """
-    Create and return a gspread client using service account credentials.
+    Return the shared gspread client, authorizing it on first use.
+
+    The client wraps one authorized HTTP session, so every sheet fetch in the
+    bot reuses the same connection pool instead of re-reading the credentials
+    file and re-authorizing per call.
 
     Returns:
         gspread.Client: Authorized Google Sheets client.
     """
-    creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-    return gspread.authorize(creds)
+    global _client
+    with _client_lock:
+        if _client is None:
+            creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+            _client = gspread.authorize(creds)
+            logger.info("[SHEETS] Authorized Google Sheets client")
+        return _client
+
+
+def fetch_sheet_values(url: str, force: bool = False) -> List[List[str]]:
+    """
+    Return every cell of the first worksheet (id=0) of the sheet at url. Blocking.
+
+    Results are cached for SHEET_CACHE_TTL seconds, and concurrent callers for the
+    same url wait on a single fetch rather than each hitting the API.
+    force=True skips the cache (e.g. an explicit resync right after a sheet edit)
+    and refreshes it with what was read.
+    The returned rows are shared and must not be mutated.
+    """
+    if not force:
+        values = _sheet_cache.get(url)
+        if values is not None:
+            return values
+
+    with _fetch_locks_guard:
+        entry = _fetch_locks.setdefault(url, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            # Another thread may have fetched it while we waited
+            values = None if force else _sheet_cache.get(url)
+            if values is None:
+                spreadsheet = get_client().open_by_url(url)
+                values = spreadsheet.get_worksheet_by_id(0).get_all_values()
+                _sheet_cache.set(url, values)
+            else:
+                logger.debug(f"[SHEETS] Shared in-flight fetch for {url}")
+    finally:
+        # Drop the url's lock once no caller holds or waits on it, so every caller
+        # of an in-flight fetch shares one lock and the dict stays small
+        with _fetch_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _fetch_locks[url]
+    return values